@@ -0,0 +1,72 @@
+"""
+导入耗时基准：检查模拟核心在固定预算内完成导入，且不会顺带加载界面库
+
+每次测量都在新的解释器进程中进行，取多次中的最小值以减少系统抖动的影响。
+超出预算或加载了 tkinter / numpy 时以非零状态码退出，可直接用于持续集成。
+
+用法示例：
+    python bench_import.py
+    python bench_import.py --budget-ms 50 --repeat 10 page_replacement_core page_replacement_cli
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+DEFAULT_MODULES = ['page_replacement_core', 'page_replacement_cli', 'trace_io', 'workloads']
+DEFAULT_BUDGET_MS = 40.0
+HEAVY_MODULES = ['tkinter', 'numpy']  # 核心导入时不应加载的模块
+
+_PROBE = '''
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+'''
+
+
+def measure_import(module, repeat=5):
+    """
+    在新进程中多次导入模块
+
+    Args:
+        module: 模块名
+        repeat: 测量次数
+
+    Returns:
+        tuple: (最短导入耗时（毫秒）, 导入后已加载的重量级模块列表)
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    code = _PROBE.format(module=module, heavy=HEAVY_MODULES)
+    best, loaded = None, []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], cwd=here, check=True,
+                                capture_output=True, text=True).stdout
+        sample = json.loads(output)
+        loaded = sample['loaded']
+        if best is None or sample['seconds'] < best:
+            best = sample['seconds']
+    return best * 1000, loaded
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="模拟核心导入耗时基准")
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES, help="要测量的模块")
+    parser.add_argument('--budget-ms', type=float, default=DEFAULT_BUDGET_MS, help="每个模块的导入预算（毫秒）")
+    parser.add_argument('--repeat', type=int, default=5, help="每个模块的测量次数")
+    args = parser.parse_args(argv)
+
+    failed = False
+    for module in args.modules:
+        elapsed_ms, loaded = measure_import(module, args.repeat)
+        ok = elapsed_ms <= args.budget_ms and not loaded
+        failed = failed or not ok
+        note = f"，额外加载了 {', '.join(loaded)}" if loaded else ""
+        print(f"{'通过' if ok else '超出'}  {module}: {elapsed_ms:.1f} ms（预算 {args.budget_ms:.0f} ms）{note}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
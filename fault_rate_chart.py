@@ -0,0 +1,137 @@
+"""
+滑动窗口缺页率曲线
+
+在任意Tk画布上绘制多个算法的缺页率曲线，共用同一坐标轴。曲线数据由
+page_replacement_core.fault_rate_series 预先抽样得到；动画播放时 show_until
+只显示到当前步为止的部分，每次更新只需二分查找和一次 coords 调用。
+本模块不导入 tkinter，只使用传入的画布对象。曲线颜色按算法在 policy_names() 中的
+位置分配，同一算法在结果图表和动画图表中颜色相同。
+"""
+from bisect import bisect_right
+
+from page_replacement_core import policy_names
+
+ALGORITHM_COLORS = {'FIFO': '#2196F3', 'OPT': '#4CAF50', 'LRU': '#FF9800'}
+EXTRA_COLORS = ('#9C27B0', '#F44336', '#00BCD4', '#795548', '#607D8B', '#E91E63')  # 其他算法按注册顺序取色
+
+
+def algorithm_color(name):
+    """
+    算法曲线的颜色：只由算法本身决定，与曲线添加的先后无关
+
+    Args:
+        name: 算法名称
+
+    Returns:
+        str: 颜色
+    """
+    if name in ALGORITHM_COLORS:
+        return ALGORITHM_COLORS[name]
+    others = [policy for policy in policy_names() if policy not in ALGORITHM_COLORS]
+    index = others.index(name) if name in others else len(others)
+    return EXTRA_COLORS[index % len(EXTRA_COLORS)]
+
+
+class FaultRateChart:
+    def __init__(self, canvas, width, height, title="滑动窗口缺页率"):
+        """
+        在画布上创建坐标轴
+
+        Args:
+            canvas: Tk画布
+            width: 绘图区域宽度（像素）
+            height: 绘图区域高度（像素）
+            title: 图表标题
+        """
+        self.canvas = canvas
+        self.left, self.top = 50, 22
+        self.right, self.bottom = width - 110, height - 20
+        self.total_steps = 1
+        self.series = {}  # 算法名称 -> (步号列表, 扁平的画布坐标列表, 曲线图形项)
+        self.visible_points = {}  # 算法名称 -> 当前显示的点数
+
+        canvas.create_text(self.left, 10, text=title, anchor='w', font=('Arial', 10, 'bold'),
+                           fill='#333333')
+        # 纵轴刻度：0%、50%、100%
+        for fraction in (0.0, 0.5, 1.0):
+            y = self._y(fraction)
+            canvas.create_line(self.left, y, self.right, y, fill='#e0e0e0')
+            canvas.create_text(self.left - 5, y, text=f"{fraction:.0%}", anchor='e', font=('Arial', 8),
+                               fill='#666666')
+        canvas.create_line(self.left, self.top, self.left, self.bottom, fill='#999999')
+        self.step_label = canvas.create_text(self.right, self.bottom + 10, text="", anchor='e',
+                                             font=('Arial', 8), fill='#666666')
+
+    def _x(self, step):
+        return self.left + (self.right - self.left) * (step + 1) / self.total_steps
+
+    def _y(self, rate):
+        return self.bottom - (self.bottom - self.top) * rate
+
+    def clear(self):
+        """删除所有曲线（保留坐标轴）"""
+        for _, _, line in self.series.values():
+            self.canvas.delete(line)
+        self.canvas.delete("chart_legend")
+        self.series = {}
+        self.visible_points = {}
+        self.canvas.itemconfig(self.step_label, text="")
+
+    def set_total_steps(self, total_steps):
+        """设置横轴的总步数（需在 set_series 之前调用）"""
+        self.total_steps = max(1, total_steps)
+        self.canvas.itemconfig(self.step_label, text=f"共 {total_steps} 步")
+
+    def set_series(self, name, steps, rates, show=True):
+        """
+        添加或替换一条曲线
+
+        Args:
+            name: 算法名称
+            steps: 抽样的步号列表
+            rates: 对应的缺页率列表（0-1）
+            show: 是否立即显示整条曲线；为False时由 show_until 逐步显示
+        """
+        is_new = name not in self.series
+        if not is_new:
+            self.canvas.delete(self.series[name][2])
+        coords = []
+        for step, rate in zip(steps, rates):
+            coords.extend((self._x(step), self._y(rate)))
+        index = len(self.series) if is_new else list(self.series).index(name)
+        color = algorithm_color(name)
+        line = self.canvas.create_line(0, 0, 0, 0, fill=color, width=2, state='hidden')
+        self.series[name] = (steps, coords, line)
+        self.visible_points[name] = 0
+
+        # 图例
+        if is_new:
+            y = self.top + 4 + index * 14
+            self.canvas.create_line(self.right + 12, y, self.right + 32, y, fill=color, width=2,
+                                    tags="chart_legend")
+            self.canvas.create_text(self.right + 38, y, text=name, anchor='w', font=('Arial', 9),
+                                    fill='#333333', tags="chart_legend")
+        if show:
+            self._show_points(name, len(steps))
+
+    def show_until(self, step):
+        """
+        各曲线只显示到第step步为止（step为-1时全部隐藏）
+
+        Args:
+            step: 最后显示的步号
+        """
+        for name, (steps, _, _) in self.series.items():
+            self._show_points(name, bisect_right(steps, step))
+
+    def _show_points(self, name, count):
+        if count == self.visible_points[name]:
+            return
+        self.visible_points[name] = count
+        _, coords, line = self.series[name]
+        if count < 2:
+            # 画布上的折线至少需要两个点
+            self.canvas.itemconfig(line, state='hidden')
+            return
+        self.canvas.coords(line, *coords[:2 * count])
+        self.canvas.itemconfig(line, state='normal')
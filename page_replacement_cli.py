@@ -0,0 +1,114 @@
+"""
+页面置换模拟的命令行入口（无界面）
+
+只依赖静默模拟内核，不导入 tkinter，可在没有显示环境的批处理节点上运行，
+结果以JSON或CSV输出，便于脚本处理。
+
+用法示例：
+    python page_replacement_cli.py --algorithm FIFO LRU --frames 4 --page-size 10 --seed 42
+    python page_replacement_cli.py --algorithm OPT --frames 64 --trace trace.pgtrace --format csv
+    python page_replacement_cli.py --algorithm LRU --frames 16 --workload zipf --length 1000000 --address-space 100000
+"""
+import argparse
+import csv
+import json
+import sys
+
+from page_replacement_core import policy_names, simulate
+from workloads import DEFAULT_ADDRESS_SPACE, WORKLOAD_LABELS, generate_workload
+
+RESULT_FIELDS = ['algorithm', 'frames', 'page_size', 'references', 'page_faults', 'fault_rate']
+
+
+def run(algorithms, frames, page_size=None, trace=None, trace_format=None, length=None, seed=None,
+        workload='permutation', address_space=DEFAULT_ADDRESS_SPACE):
+    """
+    按命令行参数运行模拟
+
+    Args:
+        algorithms: 算法名称列表
+        frames: 内存块数
+        page_size: 每页大小；为None时随机序列取10，trace取其默认值（见 trace_io.effective_page_size）
+        trace: trace文件路径，提供时在trace上流式模拟
+        trace_format: trace格式（text/csv/binary/mapped），默认按扩展名判断
+        length: 合成序列长度（默认等于地址空间大小）
+        seed: 合成序列种子
+        workload: 合成序列的访问模式，见 workloads.WORKLOAD_LABELS（默认为随机排列）
+        address_space: 合成序列的逻辑地址空间大小
+
+    Returns:
+        list: 每个算法一条结果，字段见 RESULT_FIELDS，page_size 为实际使用的页大小
+    """
+    if page_size is not None and page_size < 1:
+        raise ValueError(f"页大小必须为正整数: {page_size}")
+    if trace is not None:
+        from trace_io import effective_page_size, simulate_trace
+        # 未指定页大小时按 simulate_trace 的规则确定（mapped 格式取文件头中的值），结果中记录实际的页大小
+        page_size = effective_page_size(trace, trace_format, page_size)
+        results = [simulate_trace(algorithm, trace, frames, page_size, trace_format) for algorithm in algorithms]
+    else:
+        sequence = generate_workload(workload, address_space if length is None else length, address_space, seed)
+        page_size = 10 if page_size is None else page_size
+        results = [simulate(algorithm, sequence, frames, page_size) for algorithm in algorithms]
+    return [dict(zip(RESULT_FIELDS, (result.policy, frames, page_size, result.references,
+                                     result.page_faults, result.fault_rate)))
+            for result in results]
+
+
+def write_results(rows, file, fmt='json'):
+    """
+    输出模拟结果
+
+    Args:
+        rows: run() 返回的结果列表
+        file: 输出的文本文件对象
+        fmt: 'json' 或 'csv'
+    """
+    if fmt == 'json':
+        json.dump(rows, file, ensure_ascii=False, indent=2)
+        file.write('\n')
+    elif fmt == 'csv':
+        writer = csv.DictWriter(file, RESULT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    else:
+        raise ValueError(f"未知的输出格式: {fmt}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="页面置换算法模拟（命令行模式）")
+    parser.add_argument('--algorithm', nargs='+', default=policy_names(),
+                        help=f"算法名称，可写多个（默认全部：{' '.join(policy_names())}）")
+    parser.add_argument('--frames', type=int, default=4, help="内存块数（默认4）")
+    parser.add_argument('--page-size', type=int, help="每页大小（默认10；mapped 格式trace默认取文件头中的页大小）")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--trace', help="trace文件路径")
+    source.add_argument('--length', type=int, help="合成序列长度（默认等于地址空间大小）")
+    parser.add_argument('--workload', choices=list(WORKLOAD_LABELS), default='permutation',
+                        help="合成序列的访问模式（默认permutation，即随机排列）")
+    parser.add_argument('--address-space', type=int, default=DEFAULT_ADDRESS_SPACE,
+                        help=f"合成序列的逻辑地址空间大小（默认{DEFAULT_ADDRESS_SPACE}）")
+    parser.add_argument('--trace-format', help="trace格式（text/csv/binary/mapped），默认按扩展名判断")
+    parser.add_argument('--seed', type=int, help="合成序列种子")
+    parser.add_argument('--format', choices=['json', 'csv'], default='json', help="输出格式（默认json）")
+    parser.add_argument('--output', help="输出文件，默认为标准输出")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        rows = run(args.algorithm, args.frames, args.page_size, args.trace, args.trace_format,
+                   args.length, args.seed, args.workload, args.address_space)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            write_results(rows, f, args.format)
+    else:
+        write_results(rows, sys.stdout, args.format)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,1510 @@
+"""
+页面置换算法的静默模拟内核
+
+内核只做置换决策，不做任何格式化输出，返回缺页次数以及（可选的）逐步事件记录。
+各算法实现 ReplacementPolicy 协议并注册（见 register_policy），按名称查找；
+批量计算直接调用 simulate()；PageReplacementSimulator.trace() 在事件记录的基础上输出详细过程。
+
+本模块不依赖任何界面库，可在没有Tk的环境中导入；NumPy只在处理长序列时才按需导入。
+"""
+import heapq
+import random
+from array import array
+from collections import OrderedDict, deque, namedtuple
+
+_NUMPY_MIN_LENGTH = 4096  # 序列短于此长度时纯Python转换更快，也省去导入NumPy的开销
+_numpy = False  # 尚未尝试导入NumPy
+
+NO_VICTIM = -1  # 事件记录中表示"没有页面被置换"
+DEFAULT_CHECKPOINT_INTERVAL = 1024  # ReplayTimeline 默认的快照间隔（步数）
+
+
+def generate_random_sequence(seed=None):
+    """
+    生成一个包含0-319的随机数且互不相等的320长度列表
+
+    Args:
+        seed: 随机种子，为None时每次结果不同
+    """
+    # 使用random.shuffle来生成0-319的随机排列
+    sequence = list(range(320))  # 0-319的列表
+    random.Random(seed).shuffle(sequence)  # 随机打乱
+    return sequence
+
+
+def calculate_page_info(logical_address, page_size=10):
+    """
+    计算页号和页内地址
+
+    Args:
+        logical_address: 逻辑地址（0-319）
+        page_size: 每页大小（默认10）
+
+    Returns:
+        tuple: (页号, 页内地址)
+    """
+    page_number = logical_address // page_size
+    page_offset = logical_address % page_size
+    return page_number, page_offset
+
+
+def calculate_physical_address(page_offset, frame_number, page_size=10):
+    """
+    计算内存物理地址
+
+    Args:
+        page_offset: 页内地址
+        frame_number: 内存块号（帧号）
+        page_size: 每页大小（默认10）
+
+    Returns:
+        int: 物理地址
+    """
+    return frame_number * page_size + page_offset
+
+
+def load_numpy():
+    """
+    按需导入NumPy（可选依赖），结果缓存
+
+    Returns:
+        module: numpy模块，未安装时返回None
+    """
+    global _numpy
+    if _numpy is False:
+        try:
+            import numpy
+        except ImportError:  # NumPy为可选依赖，缺失时使用纯Python实现
+            numpy = None
+        _numpy = numpy
+    return _numpy
+
+
+def translate_addresses(sequence, page_size=10):
+    """
+    批量地址转换：将整个逻辑地址序列一次性转换为页号序列和页内地址序列
+
+    序列较长且安装了NumPy时使用向量化的divmod，否则逐个计算。
+
+    Args:
+        sequence: 逻辑地址序列
+        page_size: 每页大小（默认10）
+
+    Returns:
+        tuple: (页号列表, 页内地址列表)
+    """
+    if page_size < 1:
+        raise ValueError(f"页大小必须为正整数: {page_size}")
+    np = load_numpy() if len(sequence) >= _NUMPY_MIN_LENGTH else None
+    if np is not None:
+        page_numbers, page_offsets = np.divmod(np.asarray(sequence, dtype=np.int64), page_size)
+        return page_numbers.tolist(), page_offsets.tolist()
+    return [address // page_size for address in sequence], [address % page_size for address in sequence]
+
+
+class ResidentSet:
+    """
+    内存驻留页面集合
+
+    由 页号->内存块号 的映射、内存块表（内存块号->页号）和空闲块列表组成，
+    命中判断、查找页面所在内存块和计算物理地址均为O(1)。
+    迭代和打印时按内存块号顺序给出驻留页面，与原来的内存页面列表一致。
+    """
+
+    def __init__(self, frames):
+        self.capacity = frames
+        self.page_to_frame = {}  # 页号 -> 内存块号
+        self.frame_table = [None] * frames  # 内存块号 -> 页号，空闲块为 None
+        self.free_frames = list(range(frames - 1, -1, -1))  # 空闲块列表，末尾为编号最小的空闲块
+
+    @classmethod
+    def from_frame_table(cls, frame_table):
+        """
+        由内存块表（内存块号->页号，空闲块为 None）重建驻留集合
+
+        Args:
+            frame_table: 内存块表
+
+        Returns:
+            ResidentSet: 新的驻留集合
+        """
+        resident = cls(len(frame_table))
+        resident.frame_table = list(frame_table)
+        resident.page_to_frame = {page: frame for frame, page in enumerate(frame_table) if page is not None}
+        resident.free_frames = [frame for frame in range(len(frame_table) - 1, -1, -1) if frame_table[frame] is None]
+        return resident
+
+    def __len__(self):
+        return len(self.page_to_frame)
+
+    def __contains__(self, page_number):
+        return page_number in self.page_to_frame
+
+    def __getitem__(self, frame_number):
+        return self.frame_table[frame_number]
+
+    def __iter__(self):
+        return (page for page in self.frame_table if page is not None)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def frame_of(self, page_number):
+        """
+        查找页面所在的内存块号
+
+        Returns:
+            int: 内存块号，页面不在内存中时为 None
+        """
+        return self.page_to_frame.get(page_number)
+
+    def load(self, page_number):
+        """
+        将页面加载到空闲块
+
+        Returns:
+            int: 使用的内存块号
+        """
+        frame_number = self.free_frames.pop()
+        self.page_to_frame[page_number] = frame_number
+        self.frame_table[frame_number] = page_number
+        return frame_number
+
+    def replace(self, victim_page, page_number):
+        """
+        用新页面替换被置换页面，新页面使用被置换页面的内存块
+
+        Returns:
+            int: 使用的内存块号
+        """
+        frame_number = self.page_to_frame.pop(victim_page)
+        self.page_to_frame[page_number] = frame_number
+        self.frame_table[frame_number] = page_number
+        return frame_number
+
+
+def build_next_use(pages):
+    """
+    反向扫描一次页号序列，构建OPT算法使用的下次使用位置索引
+
+    Args:
+        pages: 页号序列
+
+    Returns:
+        list: next_use[i] 为页面 pages[i] 在位置 i 之后下一次被访问的位置，
+              之后不再被访问时为 len(pages)
+    """
+    n = len(pages)
+    next_use = [n] * n
+    last_seen = {}
+    for i in range(n - 1, -1, -1):
+        page = pages[i]
+        next_use[i] = last_seen.get(page, n)
+        last_seen[page] = i
+    return next_use
+
+
+class EventLog:
+    """
+    逐步事件记录
+
+    按指令顺序保存每一步是否缺页、访问所用的内存块号以及被置换的页号，
+    使用紧凑数组存储，不为每一步创建对象。
+    """
+
+    def __init__(self):
+        self.faults = array('b')   # 1 表示缺页，0 表示命中
+        self.frames = array('q')   # 本步访问（或加载到）的内存块号
+        self.victims = array('q')  # 被置换的页号，没有置换时为 NO_VICTIM
+
+    def __len__(self):
+        return len(self.faults)
+
+    def __getitem__(self, step):
+        """
+        Returns:
+            tuple: (是否缺页, 内存块号, 被置换的页号)
+        """
+        return bool(self.faults[step]), self.frames[step], self.victims[step]
+
+
+class ReplayTimeline:
+    """
+    事件记录上的随机定位
+
+    每隔 interval 步保存一次内存块表快照和累计缺页次数。定位到任意一步时，
+    从不晚于该步的最近快照出发，按事件记录把缺页的页面写入对应内存块即可，
+    无需重新运行置换算法，单次定位最多重放 interval 步。
+    """
+
+    def __init__(self, pages, events, frames, interval=DEFAULT_CHECKPOINT_INTERVAL):
+        """
+        Args:
+            pages: 页号序列
+            events: 该序列上的 EventLog
+            frames: 内存块数
+            interval: 快照间隔（步数）
+        """
+        if interval < 1:
+            raise ValueError(f"快照间隔必须为正整数: {interval}")
+        self.pages = pages
+        self.events = events
+        self.frames = frames
+        self.interval = interval
+        self._snapshots = []  # 第k个快照：前 k*interval 步执行后的内存块表
+        self._fault_counts = array('q')  # 第k个快照时的累计缺页次数
+
+        frame_table = [None] * frames
+        page_faults = 0
+        steps = len(events)
+        for start in range(0, steps + 1, interval):
+            self._snapshots.append(tuple(frame_table))
+            self._fault_counts.append(page_faults)
+            page_faults = self._apply(frame_table, page_faults, start, min(start + interval, steps))
+
+    def __len__(self):
+        return len(self.events)
+
+    def _apply(self, frame_table, page_faults, start, stop):
+        """把第 start 到 stop-1 步的缺页写入内存块表，返回新的累计缺页次数"""
+        for page, fault, frame in zip(self.pages[start:stop], self.events.faults[start:stop],
+                                      self.events.frames[start:stop]):
+            if fault:
+                frame_table[frame] = page
+                page_faults += 1
+        return page_faults
+
+    def state_at(self, step):
+        """
+        求执行完前 step 条指令后的内存状态
+
+        Args:
+            step: 已执行的指令数（0 表示尚未执行任何指令）
+
+        Returns:
+            tuple: (ResidentSet, 累计缺页次数)
+        """
+        if not 0 <= step <= len(self):
+            raise ValueError(f"步号超出范围: {step}")
+        checkpoint = step // self.interval
+        frame_table = list(self._snapshots[checkpoint])
+        page_faults = self._apply(frame_table, self._fault_counts[checkpoint], checkpoint * self.interval, step)
+        return ResidentSet.from_frame_table(frame_table), page_faults
+
+
+class RollingFaultRate:
+    """
+    滑动窗口缺页率
+
+    用环形缓冲区保存最近 window 步是否缺页，每步 O(1) 更新窗口内的缺页次数。
+    窗口未满时按已有步数计算。
+    """
+
+    def __init__(self, window=100):
+        if window < 1:
+            raise ValueError(f"窗口大小必须为正整数: {window}")
+        self.window = window
+        self._flags = bytearray(window)  # 环形缓冲区：最近 window 步是否缺页
+        self._steps = 0
+        self._faults = 0  # 窗口内的缺页次数
+
+    def push(self, fault):
+        """
+        记录一步
+
+        Args:
+            fault: 本步是否缺页
+
+        Returns:
+            float: 记录后窗口内的缺页率（0-1）
+        """
+        slot = self._steps % self.window
+        fault = 1 if fault else 0
+        self._faults += fault - self._flags[slot]
+        self._flags[slot] = fault
+        self._steps += 1
+        return self.rate
+
+    @property
+    def rate(self):
+        """当前窗口内的缺页率（0-1），尚未记录任何步时为0"""
+        return self._faults / min(self._steps, self.window) if self._steps else 0.0
+
+
+def fault_rate_series(faults, window=None, max_points=1000):
+    """
+    由逐步缺页标记计算滑动窗口缺页率曲线
+
+    每步 O(1) 更新，按步长抽样，点数不超过 max_points（另加最后一步）。
+
+    Args:
+        faults: 逐步缺页标记（如 EventLog.faults）
+        window: 窗口大小（步数），默认取 50 与抽样步长中的较大者
+        max_points: 最多抽样的点数
+
+    Returns:
+        tuple: (步号列表, 缺页率列表)，步号从0开始，缺页率为该步执行后的窗口缺页率
+    """
+    stride = max(1, -(-len(faults) // max_points))
+    rolling = RollingFaultRate(window or max(50, stride))
+    steps, rates = [], []
+    last = len(faults) - 1
+    for step, fault in enumerate(faults):
+        rate = rolling.push(fault)
+        if (step + 1) % stride == 0 or step == last:
+            steps.append(step)
+            rates.append(rate)
+    return steps, rates
+
+
+class SimulationResult(namedtuple('SimulationResult', ['policy', 'page_faults', 'references', 'events'])):
+    """
+    一次模拟的结果
+
+    Attributes:
+        policy: 算法名称
+        page_faults: 缺页次数
+        references: 访问次数（指令数）
+        events: EventLog，未要求记录事件时为 None
+    """
+    __slots__ = ()
+
+    @property
+    def fault_rate(self):
+        """缺页率（0-1）"""
+        return self.page_faults / self.references if self.references else 0.0
+
+
+class ReplacementPolicy:
+    """
+    页面置换算法协议
+
+    引擎负责命中判断和内存块分配（装入时取编号最小的空闲块，置换时沿用被置换页面的内存块），
+    算法只维护自己的元数据：
+    - on_hit(page, frame, step)：第step步访问的页面在内存块frame中命中
+    - on_miss(page, frame, step)：第step步缺页，页面已装入内存块frame
+    - choose_victim(page, step)：内存已满、第step步要装入页面page时选出被置换的页号，
+      并删除该页面的元数据（ARC等算法的选择取决于即将装入的页面是否在其历史记录中）
+
+    子类设置 name 并用 register_policy 注册后，批量模拟、命令行、参数扫描和界面即可按名称使用。
+    FIFO/OPT/LRU 另外提供 kernel：把协议内联进同一个循环的静默内核，批量模拟时直接调用，
+    热循环中没有逐步的方法调用；未提供 kernel 的算法由通用引擎 run_policy 驱动。
+    """
+    name = None
+    needs_future = False  # 为True时需要下次使用位置序列（见 build_next_use），如OPT
+    kernel = None  # 可选的静默内核：kernel(pages, frames, events[, next_use]) -> 缺页次数
+    reference_bits = None  # 可选的引用位数组（按内存块号索引），提供时命中只由引擎置位，不调用 on_hit
+
+    def __init__(self, frames, next_use=None):
+        """
+        Args:
+            frames: 内存块数
+            next_use: 下次使用位置序列，仅 needs_future 为True的算法会收到
+        """
+        self.frames = frames
+
+    def on_hit(self, page, frame, step):
+        pass
+
+    def on_miss(self, page, frame, step):
+        raise NotImplementedError
+
+    def choose_victim(self, page, step):
+        raise NotImplementedError
+
+
+_POLICIES = {}  # 算法名称（大写）-> ReplacementPolicy 子类，按注册顺序排列
+
+
+def register_policy(policy_class):
+    """
+    注册页面置换算法（可作为类装饰器使用）
+
+    Args:
+        policy_class: ReplacementPolicy 子类，name 不区分大小写
+
+    Returns:
+        type: policy_class 本身
+    """
+    _POLICIES[policy_class.name.upper()] = policy_class
+    return policy_class
+
+
+def get_policy(name):
+    """
+    按名称查找已注册的页面置换算法
+
+    Args:
+        name: 算法名称（不区分大小写）
+
+    Returns:
+        type: ReplacementPolicy 子类
+    """
+    policy_class = _POLICIES.get(name.upper())
+    if policy_class is None:
+        raise ValueError(f"未知的页面置换算法: {name}")
+    return policy_class
+
+
+def policy_names():
+    """
+    已注册的全部算法名称
+
+    Returns:
+        list: 按注册顺序排列的算法名称
+    """
+    return [policy_class.name for policy_class in _POLICIES.values()]
+
+
+def run_policy(policy, pages, frames, events=None):
+    """
+    通用引擎：按协议驱动一个算法实例完成模拟
+
+    Args:
+        policy: ReplacementPolicy 实例
+        pages: 页号序列（可为迭代器）
+        frames: 内存块数
+        events: EventLog，提供时记录逐步事件
+
+    Returns:
+        int: 缺页次数
+    """
+    resident = {}  # 页号 -> 内存块号
+    on_hit, on_miss, choose_victim = policy.on_hit, policy.on_miss, policy.choose_victim
+    reference_bits = policy.reference_bits
+    faults = 0
+    if events is not None:
+        log_fault, log_frame, log_victim = events.faults.append, events.frames.append, events.victims.append
+    for step, page in enumerate(pages):
+        frame = resident.get(page)
+        if frame is None:
+            victim = NO_VICTIM
+            if len(resident) < frames:
+                frame = len(resident)
+            else:
+                victim = choose_victim(page, step)
+                frame = resident.pop(victim)
+            resident[page] = frame
+            on_miss(page, frame, step)
+            faults += 1
+            if events is not None:
+                log_fault(1)
+                log_frame(frame)
+                log_victim(victim)
+        else:
+            if reference_bits is not None:
+                reference_bits[frame] = 1
+            else:
+                on_hit(page, frame, step)
+            if events is not None:
+                log_fault(0)
+                log_frame(frame)
+                log_victim(NO_VICTIM)
+    return faults
+
+
+def _run(policy_class, pages, frames, events=None, next_use=None):
+    """有静默内核时调用内核，否则由通用引擎驱动算法实例"""
+    if policy_class.needs_future and next_use is None:
+        next_use = build_next_use(pages)
+    if policy_class.kernel is None:
+        return run_policy(policy_class(frames, next_use), pages, frames, events)
+    if policy_class.needs_future:
+        return policy_class.kernel(pages, frames, events, next_use)
+    return policy_class.kernel(pages, frames, events)
+
+
+def _fifo_kernel(pages, frames, events=None):
+    """
+    FIFO内核：置换最早进入内存的页面
+
+    页面按内存块号顺序装入，之后每次置换都把新页面放入指针所指的内存块，
+    因此内存块表本身就是环形队列：指针所指即为最早进入的页面，置换后指针后移一格。
+    """
+    resident = {}  # 页号 -> 内存块号
+    frame_table = [None] * frames  # 内存块号 -> 页号
+    hand = 0
+    faults = 0
+    if events is not None:
+        log_fault, log_frame, log_victim = events.faults.append, events.frames.append, events.victims.append
+    for page in pages:
+        frame = resident.get(page)
+        if frame is None:
+            victim = NO_VICTIM
+            if len(resident) < frames:
+                frame = len(resident)
+            else:
+                frame = hand
+                victim = frame_table[frame]
+                del resident[victim]
+                hand += 1
+                if hand == frames:
+                    hand = 0
+            resident[page] = frame
+            frame_table[frame] = page
+            faults += 1
+            if events is not None:
+                log_fault(1)
+                log_frame(frame)
+                log_victim(victim)
+        elif events is not None:
+            log_fault(0)
+            log_frame(frame)
+            log_victim(NO_VICTIM)
+    return faults
+
+
+def _lru_kernel(pages, frames, events=None):
+    """
+    LRU内核：置换最长时间未被访问的页面
+
+    内存中页面保存在按访问顺序排列的有序字典中（页号 -> 内存块号），
+    命中时移到末尾，置换时弹出最前面的页面，均为O(1)。
+    """
+    recency = OrderedDict()  # 页号 -> 内存块号，最久未访问的在最前
+    touch = recency.move_to_end
+    faults = 0
+    if events is not None:
+        log_fault, log_frame, log_victim = events.faults.append, events.frames.append, events.victims.append
+    for page in pages:
+        frame = recency.get(page)
+        if frame is None:
+            victim = NO_VICTIM
+            if len(recency) < frames:
+                frame = len(recency)
+            else:
+                victim, frame = recency.popitem(last=False)
+            recency[page] = frame
+            faults += 1
+            if events is not None:
+                log_fault(1)
+                log_frame(frame)
+                log_victim(victim)
+        else:
+            touch(page)
+            if events is not None:
+                log_fault(0)
+                log_frame(frame)
+                log_victim(NO_VICTIM)
+    return faults
+
+
+def _opt_kernel(pages, frames, events=None, next_use=None):
+    """
+    OPT内核：置换下次使用位置最晚的页面
+
+    内存中页面保存在以(-下次使用位置, 内存块号, 页号)为键的堆中，
+    过期条目在弹出时丢弃；下次使用位置相同（均不再使用）时选择内存块号最小的页面。
+    next_use 为与 pages 等长的下次使用位置序列（可为迭代器），未提供时由 pages 构建。
+    """
+    if next_use is None:
+        next_use = build_next_use(pages)
+    resident = {}  # 页号 -> 内存块号
+    next_of = {}  # 内存中页面 -> 下次使用位置
+    heap = []
+    heap_limit = 2 * frames + 16
+    faults = 0
+    if events is not None:
+        log_fault, log_frame, log_victim = events.faults.append, events.frames.append, events.victims.append
+    for page, upcoming in zip(pages, next_use):
+        frame = resident.get(page)
+        if frame is None:
+            victim = NO_VICTIM
+            if len(resident) < frames:
+                frame = len(resident)
+            else:
+                while True:
+                    neg_next, frame, victim = heapq.heappop(heap)
+                    if next_of.get(victim) == -neg_next:
+                        break
+                del next_of[victim]
+                del resident[victim]
+            resident[page] = frame
+            faults += 1
+            if events is not None:
+                log_fault(1)
+                log_frame(frame)
+                log_victim(victim)
+        elif events is not None:
+            log_fault(0)
+            log_frame(frame)
+            log_victim(NO_VICTIM)
+        next_of[page] = upcoming
+        heapq.heappush(heap, (-upcoming, frame, page))
+        if len(heap) > heap_limit:
+            # 过期条目过多时按当前内存重建堆，堆大小保持为O(内存块数)
+            heap = [(-next_of[p], f, p) for p, f in resident.items()]
+            heapq.heapify(heap)
+    return faults
+
+
+@register_policy
+class FIFOPolicy(ReplacementPolicy):
+    """FIFO：置换最早进入内存的页面"""
+    name = 'FIFO'
+    kernel = staticmethod(_fifo_kernel)
+
+    def __init__(self, frames, next_use=None):
+        super().__init__(frames)
+        self.queue = deque()  # 内存中页面按装入顺序排列
+
+    def on_miss(self, page, frame, step):
+        self.queue.append(page)
+
+    def choose_victim(self, page, step):
+        return self.queue.popleft()
+
+
+@register_policy
+class OPTPolicy(ReplacementPolicy):
+    """OPT：置换下次使用位置最晚的页面，位置相同时取内存块号最小的页面"""
+    name = 'OPT'
+    needs_future = True
+    kernel = staticmethod(_opt_kernel)
+
+    def __init__(self, frames, next_use=None):
+        super().__init__(frames)
+        self.next_use = next_use
+        self.next_of = {}  # 内存中页面 -> 下次使用位置
+        self.frame_of = {}  # 内存中页面 -> 内存块号
+        self.heap = []  # (-下次使用位置, 内存块号, 页号)，过期条目在弹出时丢弃
+
+    def on_hit(self, page, frame, step):
+        upcoming = self.next_use[step]
+        self.next_of[page] = upcoming
+        heapq.heappush(self.heap, (-upcoming, frame, page))
+        if len(self.heap) > 2 * self.frames + 16:
+            self.heap = [(-self.next_of[p], f, p) for p, f in self.frame_of.items()]
+            heapq.heapify(self.heap)
+
+    def on_miss(self, page, frame, step):
+        self.frame_of[page] = frame
+        self.on_hit(page, frame, step)
+
+    def choose_victim(self, page, step):
+        while True:
+            neg_next, _, victim = heapq.heappop(self.heap)
+            if self.next_of.get(victim) == -neg_next:
+                break
+        del self.next_of[victim]
+        del self.frame_of[victim]
+        return victim
+
+
+@register_policy
+class LRUPolicy(ReplacementPolicy):
+    """LRU：置换最长时间未被访问的页面"""
+    name = 'LRU'
+    kernel = staticmethod(_lru_kernel)
+
+    def __init__(self, frames, next_use=None):
+        super().__init__(frames)
+        self.recency = OrderedDict()  # 内存中页面按访问顺序排列，最久未访问的在最前
+
+    def on_hit(self, page, frame, step):
+        self.recency.move_to_end(page)
+
+    def on_miss(self, page, frame, step):
+        self.recency[page] = None
+
+    def choose_victim(self, page, step):
+        return self.recency.popitem(last=False)[0]
+
+
+@register_policy
+class CLOCKPolicy(ReplacementPolicy):
+    """
+    CLOCK（二次机会）：LRU的低开销近似
+
+    内存块排成一圈，每块一个引用位。命中时只把引用位置1；置换时指针顺时针转动，
+    引用位为1的页面清零后获得第二次机会，遇到引用位为0的页面即置换，均摊O(1)。
+    """
+    name = 'CLOCK'
+
+    def __init__(self, frames, next_use=None):
+        super().__init__(frames)
+        self.reference_bits = bytearray(frames)  # 内存块号 -> 引用位
+        self.frame_table = [None] * frames  # 内存块号 -> 页号
+        self.hand = 0  # 时钟指针（内存块号）
+
+    def on_hit(self, page, frame, step):
+        self.reference_bits[frame] = 1
+
+    def on_miss(self, page, frame, step):
+        self.frame_table[frame] = page
+        self.reference_bits[frame] = 1
+
+    def choose_victim(self, page, step):
+        bits, hand = self.reference_bits, self.hand
+        while bits[hand]:
+            bits[hand] = 0
+            hand = hand + 1 if hand + 1 < self.frames else 0
+        self.hand = hand + 1 if hand + 1 < self.frames else 0
+        return self.frame_table[hand]
+
+
+@register_policy
+class CLOCKProPolicy(ReplacementPolicy):
+    """
+    CLOCK-Pro：在时钟上按重用距离区分冷热页面（Jiang、Chen、Zhang，USENIX 2005）
+
+    驻留的热页面、驻留的冷页面，以及处于测试期、已被置换的冷页面（只保留元数据）
+    排在同一个环形链表中，新页面插到 hand_hot 之后处理的位置（表头）。三个指针：
+    - hand_cold：寻找引用位为0的驻留冷页面置换；引用位为1且在测试期内的冷页面升为热页面
+    - hand_hot：热页面超过配额时，把引用位为0的热页面降为冷页面，途经的冷页面结束测试期
+    - hand_test：非驻留冷页面超过内存块数时，结束测试期并删除最老的非驻留页面
+    冷页面配额随测试期内的再次访问增加、随测试期的过期减少。
+
+    驻留冷页面另外串成一个按进入冷状态先后排列的小环，hand_cold 只在这个环上转动，
+    不必逐个跳过热页面和非驻留页面，置换为均摊O(1)。链表用按槽位编号索引的数组实现，
+    引用位按内存块号存放，命中时只置位；元数据最多为内存块数的两倍。
+    """
+    name = 'CLOCK-Pro'
+
+    def __init__(self, frames, next_use=None):
+        super().__init__(frames)
+        self.reference_bits = bytearray(frames)  # 内存块号 -> 引用位
+        self.max_cold = max(1, frames - 1)
+        self.cold_target = 1  # 驻留冷页面的配额，热页面配额为 frames - cold_target
+        self.hot_count = 0
+        self.non_resident = 0  # 非驻留（测试期内已被置换）的冷页面数
+        self.slot_of = {}  # 页号 -> 槽位
+        # 各槽位的属性；槽位在页面离开链表后回收复用
+        self.page_of = []
+        self.frame_of = []  # 驻留页面的内存块号，非驻留页面为 -1
+        self.next = []
+        self.prev = []
+        self.cold_next = []  # 驻留冷页面环
+        self.cold_prev = []
+        self.hot = bytearray()
+        self.test = bytearray()
+        self.free_slots = []
+        self.hand_hot = self.hand_test = None
+        self.hand_cold = None  # 指向驻留冷页面环
+
+    def _new_slot(self, page, frame):
+        if self.free_slots:
+            slot = self.free_slots.pop()
+            self.page_of[slot], self.frame_of[slot] = page, frame
+        else:
+            slot = len(self.page_of)
+            self.page_of.append(page)
+            self.frame_of.append(frame)
+            self.next.append(slot)
+            self.prev.append(slot)
+            self.cold_next.append(slot)
+            self.cold_prev.append(slot)
+            self.hot.append(0)
+            self.test.append(0)
+        self.slot_of[page] = slot
+        return slot
+
+    def _insert_head(self, slot):
+        # 表头是 hand_hot 之前的位置，新页面要等指针转过一整圈才会被处理
+        if self.hand_hot is None:
+            self.next[slot] = self.prev[slot] = slot
+            self.hand_hot = self.hand_test = slot
+            return
+        after = self.hand_hot
+        before = self.prev[after]
+        self.next[before], self.prev[slot] = slot, before
+        self.next[slot], self.prev[after] = after, slot
+
+    def _unlink(self, slot):
+        following = self.next[slot]
+        if following == slot:
+            self.hand_hot = self.hand_test = None
+            return
+        if self.hand_hot == slot:
+            self.hand_hot = following
+        if self.hand_test == slot:
+            self.hand_test = following
+        before = self.prev[slot]
+        self.next[before], self.prev[following] = following, before
+
+    def _remove(self, slot):
+        self._unlink(slot)
+        del self.slot_of[self.page_of[slot]]
+        self.free_slots.append(slot)
+
+    def _cold_append(self, slot):
+        """页面成为驻留冷页面：放到冷页面环中 hand_cold 最后才转到的位置"""
+        hand = self.hand_cold
+        if hand is None:
+            self.cold_next[slot] = self.cold_prev[slot] = self.hand_cold = slot
+            return
+        before = self.cold_prev[hand]
+        self.cold_next[before], self.cold_prev[slot] = slot, before
+        self.cold_next[slot], self.cold_prev[hand] = hand, slot
+
+    def _cold_discard(self, slot):
+        """页面不再是驻留冷页面（被置换或升为热页面）"""
+        following = self.cold_next[slot]
+        if following == slot:
+            self.hand_cold = None
+            return
+        if self.hand_cold == slot:
+            self.hand_cold = following
+        before = self.cold_prev[slot]
+        self.cold_next[before], self.cold_prev[following] = following, before
+
+    def _move_to_head(self, slot):
+        self._unlink(slot)
+        self._insert_head(slot)
+
+    def _end_test(self, slot):
+        """冷页面的测试期结束且未被再次访问：冷页面配额减1，非驻留页面离开链表"""
+        self.test[slot] = 0
+        self.cold_target = max(1, self.cold_target - 1)
+        if self.frame_of[slot] < 0:
+            self._remove(slot)
+            self.non_resident -= 1
+            return True
+        return False
+
+    def _run_hand_hot(self):
+        """把一个引用位为0的热页面降为冷页面"""
+        bits = self.reference_bits
+        while True:
+            slot = self.hand_hot
+            self.hand_hot = self.next[slot]
+            if self.hot[slot]:
+                frame = self.frame_of[slot]
+                if bits[frame]:
+                    bits[frame] = 0
+                else:
+                    self.hot[slot] = 0
+                    self.hot_count -= 1
+                    self._cold_append(slot)
+                    return
+            elif self.test[slot]:
+                self._end_test(slot)
+
+    def _run_hand_test(self):
+        """删除最老的一个非驻留冷页面"""
+        while True:
+            slot = self.hand_test
+            self.hand_test = self.next[slot]
+            if not self.hot[slot] and self.test[slot] and self._end_test(slot):
+                return
+
+    def _balance_hot(self):
+        while self.hot_count > self.frames - self.cold_target:
+            self._run_hand_hot()
+
+    def on_hit(self, page, frame, step):
+        self.reference_bits[frame] = 1
+
+    def on_miss(self, page, frame, step):
+        slot = self.slot_of.get(page)
+        if slot is not None:
+            # 非驻留冷页面在测试期内再次被访问：重用距离较短，升为热页面并增加冷页面配额
+            self.non_resident -= 1
+            self.frame_of[slot] = frame
+            self.test[slot] = 0
+            self.hot[slot] = 1
+            self.hot_count += 1
+            self.cold_target = min(self.cold_target + 1, self.max_cold)
+            self._move_to_head(slot)
+        else:
+            slot = self._new_slot(page, frame)
+            if self.hot_count < self.frames - self.cold_target:
+                # 热页面配额未满时（如刚开始运行）新页面直接作为热页面
+                self.hot[slot], self.test[slot] = 1, 0
+                self.hot_count += 1
+            else:
+                self.hot[slot], self.test[slot] = 0, 1
+                self._cold_append(slot)
+            self._insert_head(slot)
+        self.reference_bits[frame] = 0
+        self._balance_hot()
+
+    def choose_victim(self, page, step):
+        bits = self.reference_bits
+        while True:
+            slot = self.hand_cold
+            frame = self.frame_of[slot]
+            if bits[frame]:
+                # 被访问过的冷页面：测试期内则升为热页面，否则开始新的测试期，二者都移到表头
+                bits[frame] = 0
+                if self.test[slot]:
+                    self._cold_discard(slot)
+                    self.test[slot] = 0
+                    self.hot[slot] = 1
+                    self.hot_count += 1
+                    self._move_to_head(slot)
+                    self._balance_hot()
+                else:
+                    # 指针越过后该页面即位于冷页面环的末尾
+                    self.hand_cold = self.cold_next[slot]
+                    self.test[slot] = 1
+                    self._move_to_head(slot)
+                continue
+            victim = self.page_of[slot]
+            self._cold_discard(slot)
+            if self.test[slot]:
+                # 测试期内被置换：保留元数据，以便在测试期内再次访问时识别
+                self.frame_of[slot] = -1
+                self.non_resident += 1
+                if self.non_resident > self.frames:
+                    self._run_hand_test()
+            else:
+                self._remove(slot)
+            return victim
+
+
+@register_policy
+class ARCPolicy(ReplacementPolicy):
+    """
+    ARC（自适应替换缓存，Megiddo、Modha，FAST 2003）
+
+    T1 保存只访问过一次的驻留页面，T2 保存访问过至少两次的驻留页面；B1、B2 分别是从 T1、T2
+    置换出去的页面的幽灵记录（只有页号）。幽灵命中说明对应的一侧分得太少，据此调整 T1 的目标
+    大小 p。四个表都是按访问顺序排列的有序字典，每步操作O(1)；T1+B1 不超过内存块数，
+    四个表合计不超过内存块数的两倍。
+    """
+    name = 'ARC'
+
+    def __init__(self, frames, next_use=None):
+        super().__init__(frames)
+        self.target = 0.0  # T1 的目标大小 p
+        self.t1 = OrderedDict()  # 最久未访问的在最前
+        self.t2 = OrderedDict()
+        self.b1 = OrderedDict()
+        self.b2 = OrderedDict()
+
+    def on_hit(self, page, frame, step):
+        if page in self.t1:
+            del self.t1[page]
+            self.t2[page] = None
+        else:
+            self.t2.move_to_end(page)
+
+    def on_miss(self, page, frame, step):
+        # 幽灵命中的页面进入 T2，新页面进入 T1（p 的调整已在 choose_victim 中完成）
+        if page in self.b1:
+            del self.b1[page]
+            self.t2[page] = None
+        elif page in self.b2:
+            del self.b2[page]
+            self.t2[page] = None
+        else:
+            self.t1[page] = None
+
+    def _replace(self, in_b2):
+        """按目标大小从 T1 或 T2 置换最久未访问的页面，并记入对应的幽灵表"""
+        t1_size = len(self.t1)
+        if t1_size and (t1_size > self.target or (in_b2 and t1_size == self.target)):
+            victim = self.t1.popitem(last=False)[0]
+            self.b1[victim] = None
+        else:
+            victim = self.t2.popitem(last=False)[0]
+            self.b2[victim] = None
+        return victim
+
+    def choose_victim(self, page, step):
+        b1_size, b2_size = len(self.b1), len(self.b2)
+        if page in self.b1:
+            self.target = min(self.frames, self.target + max(b2_size / b1_size, 1))
+            return self._replace(False)
+        if page in self.b2:
+            self.target = max(0.0, self.target - max(b1_size / b2_size, 1))
+            return self._replace(True)
+        if len(self.t1) + b1_size == self.frames:
+            if len(self.t1) < self.frames:
+                self.b1.popitem(last=False)
+                return self._replace(False)
+            return self.t1.popitem(last=False)[0]  # T1 占满全部内存块：直接丢弃，不留幽灵记录
+        if len(self.t1) + len(self.t2) + b1_size + b2_size >= 2 * self.frames:
+            self.b2.popitem(last=False)
+        return self._replace(False)
+
+
+@register_policy
+class TwoQPolicy(ReplacementPolicy):
+    """
+    2Q（Johnson、Shasha，VLDB 1994，完整版本）
+
+    新页面先进入先进先出队列 A1in；从 A1in 置换出去的页面把页号记入幽灵队列 A1out，
+    在 A1out 中时再次被访问才进入按LRU管理的 Am。一次性扫描的页面只经过 A1in，
+    不会挤掉 Am 中的常用页面。A1in 的配额为内存块数的1/4，A1out 最多记录内存块数的1/2，
+    各队列均为有序字典，每步操作O(1)。
+    """
+    name = '2Q'
+
+    def __init__(self, frames, next_use=None):
+        super().__init__(frames)
+        self.in_limit = max(1, frames // 4)  # Kin
+        self.out_limit = max(1, frames // 2)  # Kout
+        self.a1in = OrderedDict()  # 最早进入的在最前
+        self.a1out = OrderedDict()
+        self.am = OrderedDict()  # 最久未访问的在最前
+
+    def on_hit(self, page, frame, step):
+        # A1in 中的页面命中时不做调整
+        if page in self.am:
+            self.am.move_to_end(page)
+
+    def on_miss(self, page, frame, step):
+        if page in self.a1out:
+            del self.a1out[page]
+            self.am[page] = None
+        else:
+            self.a1in[page] = None
+        # 先取出即将装入的页面再裁剪，避免它在升入 Am 之前被挤出 A1out
+        while len(self.a1out) > self.out_limit:
+            self.a1out.popitem(last=False)
+
+    def choose_victim(self, page, step):
+        if len(self.a1in) > self.in_limit or not self.am:
+            victim = self.a1in.popitem(last=False)[0]
+            self.a1out[victim] = None
+            return victim
+        return self.am.popitem(last=False)[0]
+
+
+@register_policy
+class LFUPolicy(ReplacementPolicy):
+    """
+    LFU（最不经常使用）：置换访问次数最少的页面，次数相同时置换最早达到该次数的页面
+
+    按访问次数分桶（Shah、Mitra、Matani，2010 的O(1) LFU）：每个次数一个有序字典，
+    另记最小次数 min_count。命中时页面移入下一个桶，缺页时进入次数为1的桶，置换时取
+    最小次数桶中的第一个页面，都是O(1)，无需堆或线性查找最小值。被置换页面的计数随之删除，
+    元数据只与驻留页面数有关，不随出现过的页面总数增长。
+    """
+    name = 'LFU'
+
+    def __init__(self, frames, next_use=None):
+        super().__init__(frames)
+        self.counts = {}  # 驻留页号 -> 访问次数
+        self.buckets = {}  # 访问次数 -> 有序字典（最早进入该桶的页面在最前）
+        self.min_count = 0
+
+    def on_hit(self, page, frame, step):
+        count = self.counts[page]
+        bucket = self.buckets[count]
+        del bucket[page]
+        if not bucket:
+            del self.buckets[count]
+            if self.min_count == count:
+                self.min_count = count + 1
+        self.counts[page] = count + 1
+        self.buckets.setdefault(count + 1, OrderedDict())[page] = None
+
+    def on_miss(self, page, frame, step):
+        self.counts[page] = 1
+        self.buckets.setdefault(1, OrderedDict())[page] = None
+        self.min_count = 1
+
+    def choose_victim(self, page, step):
+        # 置换后紧接着 on_miss 把 min_count 置为1，这里不必重新计算
+        bucket = self.buckets[self.min_count]
+        victim = bucket.popitem(last=False)[0]
+        if not bucket:
+            del self.buckets[self.min_count]
+        del self.counts[victim]
+        return victim
+
+
+@register_policy
+class LFUDecayPolicy(LFUPolicy):
+    """
+    带老化的LFU：每隔 decay_period × 内存块数 次访问，所有驻留页面的访问次数减半（至少为1）
+
+    单纯的LFU会让早期访问频繁、之后不再使用的页面长期占据内存；定期减半使计数偏向近期。
+    减半时按次数从小到大重建各桶，耗时与内存块数成正比，分摊到每次访问为O(1)。
+    """
+    name = 'LFU-Decay'
+    decay_period = 8
+
+    def __init__(self, frames, next_use=None):
+        super().__init__(frames)
+        self.next_decay = self.decay_period * frames  # 下一次减半的步号
+
+    def _decay(self, step):
+        """到达减半的步号时将所有访问次数减半"""
+        if step < self.next_decay:
+            return
+        self.next_decay = step + self.decay_period * self.frames
+        buckets = {}
+        for count in sorted(self.buckets):
+            halved = (count + 1) >> 1
+            bucket = buckets.setdefault(halved, OrderedDict())
+            for resident in self.buckets[count]:
+                self.counts[resident] = halved
+                bucket[resident] = None
+        self.buckets = buckets
+        self.min_count = min(buckets, default=0)
+
+    def on_hit(self, page, frame, step):
+        self._decay(step)
+        super().on_hit(page, frame, step)
+
+    def choose_victim(self, page, step):
+        self._decay(step)
+        return super().choose_victim(page, step)
+
+    def on_miss(self, page, frame, step):
+        self._decay(step)
+        super().on_miss(page, frame, step)
+
+
+def simulate(policy, sequence, frames, page_size=10, record_events=False):
+    """
+    静默运行一次页面置换模拟
+
+    Args:
+        policy: 算法名称（见 policy_names，不区分大小写）
+        sequence: 逻辑地址序列
+        frames: 内存块数
+        page_size: 每页大小（默认10）
+        record_events: 是否记录逐步事件
+
+    Returns:
+        SimulationResult: 模拟结果
+    """
+    pages, _ = translate_addresses(sequence, page_size)
+    return simulate_pages(policy, pages, frames, record_events)
+
+
+def simulate_pages(policy, pages, frames, record_events=False):
+    """
+    在已转换好的页号序列上静默运行一次页面置换模拟
+
+    Args:
+        policy: 算法名称（见 policy_names，不区分大小写）
+        pages: 页号序列（见 translate_addresses）
+        frames: 内存块数
+        record_events: 是否记录逐步事件
+
+    Returns:
+        SimulationResult: 模拟结果
+    """
+    policy_class = get_policy(policy)
+    if frames < 1:
+        raise ValueError(f"内存块数必须为正整数: {frames}")
+    events = EventLog() if record_events else None
+    faults = _run(policy_class, pages, frames, events)
+    return SimulationResult(policy_class.name, faults, len(pages), events)
+
+
+def simulate_stream(policy, chunks, frames, page_size=10, next_use=None):
+    """
+    在分块到达的逻辑地址流上静默运行模拟，只保存内存状态，内存占用与序列长度无关
+
+    大多数算法直接逐块消费地址流；OPT等需要未来信息的算法必须通过 next_use
+    提供与地址流等长的下次使用位置序列（可为迭代器，见 trace_io.simulate_trace）。
+
+    Args:
+        policy: 算法名称（见 policy_names，不区分大小写）
+        chunks: 逻辑地址块的可迭代对象，每块为地址序列
+        frames: 内存块数
+        page_size: 每页大小（默认10）
+        next_use: OPT算法的下次使用位置序列
+
+    Returns:
+        SimulationResult: 模拟结果（不含事件记录）
+    """
+    policy_class = get_policy(policy)
+    if frames < 1:
+        raise ValueError(f"内存块数必须为正整数: {frames}")
+    if policy_class.needs_future and next_use is None:
+        raise ValueError(f"{policy_class.name}算法需要下次使用位置序列才能流式运行")
+    references = 0
+
+    def page_stream():
+        nonlocal references
+        for chunk in chunks:
+            references += len(chunk)
+            if page_size == 1:
+                # 页大小为1时地址即页号，直接消费数据块（可为内存映射的视图）
+                yield from chunk
+            else:
+                yield from translate_addresses(chunk, page_size)[0]
+
+    faults = _run(policy_class, page_stream(), frames, None, next_use)
+    return SimulationResult(policy_class.name, faults, references, None)
+
+
+class PageReplacementSimulator:
+    def __init__(self, total_instructions=320, page_size=10, memory_blocks=4,sequence=[]):
+        """
+        初始化页面置换模拟器
+        
+        Args:
+            total_instructions: 总指令数
+            page_size: 每页指令数
+            memory_blocks: 内存块数
+            sequence: 指令访问序列
+        """
+        self.total_instructions = total_instructions
+        self.page_size = page_size
+        self.memory_blocks = memory_blocks
+        self.total_pages = total_instructions // page_size  # 32页
+        self.sequence = sequence #对应每条指令的逻辑地址
+
+        # 内存状态
+        self.memory = ResidentSet(memory_blocks)  # 当前在内存中的页面（按内存块号排列）
+        self.page_faults = 0  # 缺页次数
+        self._translation = None  # 批量地址转换结果缓存：(页大小, 页号列表, 页内地址列表)
+        self._event_logs = {}  # 各算法的逐步事件记录缓存，键为 (算法, 页大小, 内存块数)
+
+    def reset(self):
+        """
+        重置模拟器到初始状态
+        """
+        self.memory = ResidentSet(self.memory_blocks)  # 清空内存
+        self.page_faults = 0  # 重置缺页次数
+        print("模拟器已重置到初始状态")
+
+    def trace(self, policy):
+        """
+        运行静默内核并按事件记录逐步输出模拟过程（适用于任何已注册的算法）
+        
+        Args:
+            policy: 算法名称（见 policy_names）
+        
+        Returns:
+            int: 缺页次数
+        """
+        # 事件记录从空内存开始，先清空上一次运行留下的状态（同一模拟器可多次运行各算法）
+        self.memory = ResidentSet(self.memory_blocks)
+        self.page_faults = 0
+        page_numbers, page_offsets = self.get_translated_sequence()
+        events = self.get_event_log(policy)
+        policy_class = get_policy(policy)
+        # 需要未来信息的算法（如OPT）在置换时注明算法名称
+        victim_suffix = f"（{policy_class.name}算法）" if policy_class.needs_future else ""
+        for i in range(self.total_instructions):
+            print("--------------------------------")
+            print(f"指令：{i}，逻辑地址为：{self.sequence[i]}")
+            page_number, page_offset = page_numbers[i], page_offsets[i]
+            print(f"页号：{page_number}，页内地址：{page_offset}")
+            print(f"内存中页面：{self.memory}")
+            fault, frame_number, victim_page = events[i]
+            if fault:
+                print("发生缺页中断")
+                if victim_page == NO_VICTIM:
+                    self.memory.load(page_number)
+                    print(f"页面{page_number}被加载到内存")
+                else:
+                    self.memory.replace(victim_page, page_number)  # 直接替换
+                    print(f"页面{victim_page}被置换出内存{victim_suffix}")
+                    print(f"页面{page_number}被加载到内存块{frame_number}")
+                self.page_faults += 1
+                print(f"更换后内存中页面：{self.memory}")
+            else:
+                print(f"指令：{i}在内存中，其在内存中物理地址为：{calculate_physical_address(page_offset, frame_number, self.page_size)}")
+            print("--------------------------------")
+
+        return self.page_faults
+
+    def FIFO(self):
+        """
+        先进先出页面置换算法（逐步输出过程，批量计算请使用 simulate）
+        """
+        return self.trace('FIFO')
+
+    def OPT(self):
+        """
+        最佳置换算法（逐步输出过程，批量计算请使用 simulate）
+        """
+        return self.trace('OPT')
+
+    def LRU(self):
+        """
+        LRU页面置换算法（逐步输出过程，批量计算请使用 simulate）
+        """
+        return self.trace('LRU')
+
+    def get_translated_sequence(self):
+        """
+        获取整个序列的页号和页内地址（首次调用时批量转换并缓存，页大小改变后重新转换）
+        
+        Returns:
+            tuple: (页号列表, 页内地址列表)
+        """
+        if self._translation is None or self._translation[0] != self.page_size:
+            page_numbers, page_offsets = translate_addresses(self.sequence, self.page_size)
+            self._translation = (self.page_size, page_numbers, page_offsets)
+            self._event_logs = {}
+        return self._translation[1], self._translation[2]
+
+    def get_event_log(self, policy):
+        """
+        获取算法在当前序列上的逐步事件记录（首次调用时运行静默内核并缓存）
+        
+        动画和逐步输出都只按步号读取记录中的决策，不再重新选择被置换页面。
+        
+        Args:
+            policy: 算法名称（见 policy_names，不区分大小写）
+        
+        Returns:
+            EventLog: 每一步的 (是否缺页, 内存块号, 被置换页号)
+        """
+        page_numbers = self.get_translated_sequence()[0]
+        key = (policy.upper(), self.page_size, self.memory_blocks)
+        if key not in self._event_logs:
+            self._event_logs[key] = simulate_pages(policy, page_numbers, self.memory_blocks,
+                                                   record_events=True).events
+        return self._event_logs[key]
+
+
+class MissRatioCurve(namedtuple('MissRatioCurve', ['policy', 'references', 'page_faults'])):
+    """
+    缺页曲线：同一序列在 1..N 个内存块下的缺页次数
+
+    Attributes:
+        policy: 算法名称
+        references: 访问次数（指令数）
+        page_faults: 列表，page_faults[c - 1] 为 c 个内存块时的缺页次数
+    """
+    __slots__ = ()
+
+    @property
+    def max_frames(self):
+        """曲线覆盖的最大内存块数"""
+        return len(self.page_faults)
+
+    def faults_at(self, frames):
+        """查询指定内存块数（1..max_frames）下的缺页次数"""
+        if not 1 <= frames <= len(self.page_faults):
+            raise ValueError(f"内存块数超出缺页曲线范围 1..{len(self.page_faults)}: {frames}")
+        return self.page_faults[frames - 1]
+
+    def miss_ratios(self):
+        """各内存块数下的缺页率列表，下标含义与 page_faults 相同"""
+        if not self.references:
+            return [0.0] * len(self.page_faults)
+        return [faults / self.references for faults in self.page_faults]
+
+
+def stack_distance_histogram(pages):
+    """
+    单次扫描计算LRU栈距离（Mattson算法）
+
+    用树状数组标记每个页面最近一次访问的位置，某次访问的栈距离即为
+    该页面上次访问之后被访问过的不同页面数加一，每次访问O(log n)。
+
+    Args:
+        pages: 页号序列
+
+    Returns:
+        tuple: (histogram, cold_misses)，histogram[d] 为栈距离为 d 的访问次数（d >= 1），
+               cold_misses 为首次访问的次数
+    """
+    n = len(pages)
+    tree = [0] * (n + 1)  # 树状数组，位置 t 为 1 表示某页面最近一次访问在时刻 t
+    last_access = {}
+    histogram = [0]
+    cold_misses = 0
+    for t, page in enumerate(pages, 1):
+        previous = last_access.get(page)
+        if previous is None:
+            cold_misses += 1
+            histogram.append(0)
+        else:
+            # 统计时刻 previous 之后的标记数
+            marked_before = 0
+            i = previous
+            while i:
+                marked_before += tree[i]
+                i &= i - 1
+            histogram[len(last_access) - marked_before + 1] += 1
+            i = previous
+            while i <= n:
+                tree[i] -= 1
+                i += i & -i
+        i = t
+        while i <= n:
+            tree[i] += 1
+            i += i & -i
+        last_access[page] = t
+    return histogram, cold_misses
+
+
+def lru_miss_ratio_curve(sequence, max_frames=None, page_size=10):
+    """
+    一次扫描得到LRU在 1..max_frames 个内存块下的缺页次数
+
+    LRU是栈算法：栈距离不超过内存块数的访问命中，其余缺页。
+
+    Args:
+        sequence: 逻辑地址序列
+        max_frames: 最大内存块数（默认取序列中不同页面的个数）
+        page_size: 每页大小（默认10）
+
+    Returns:
+        MissRatioCurve: LRU缺页曲线
+    """
+    pages, _ = translate_addresses(sequence, page_size)
+    histogram, cold_misses = stack_distance_histogram(pages)
+    if max_frames is None:
+        max_frames = max(len(histogram) - 1, 1)
+    page_faults = [0] * max_frames
+    # 自大到小累加，c 个内存块时栈距离大于 c 的访问都会缺页
+    misses = cold_misses + sum(histogram[max_frames + 1:])
+    for frames in range(max_frames, 0, -1):
+        page_faults[frames - 1] = misses
+        if frames < len(histogram):
+            misses += histogram[frames]
+    return MissRatioCurve('LRU', len(pages), page_faults)
+
+
+def opt_miss_ratio_curve(sequence, max_frames=None, page_size=10):
+    """
+    一次扫描得到OPT在 1..max_frames 个内存块下的缺页次数
+
+    OPT同样是栈算法：按下次使用位置作为优先级维护一个优先级栈（Mattson算法），
+    栈顶 c 个页面即为 c 个内存块时OPT保留在内存中的页面。被访问页面移到栈顶后，
+    原栈顶页面沿栈向下与各层比较，下次使用较早者留在该层、较晚者继续下移，
+    直到填入被访问页面原来的位置。栈深度限制为 max_frames，
+    总耗时为 O(n·max_frames)，取代逐个内存块数重跑OPT。
+
+    Args:
+        sequence: 逻辑地址序列
+        max_frames: 最大内存块数（默认取序列中不同页面的个数）
+        page_size: 每页大小（默认10）
+
+    Returns:
+        MissRatioCurve: OPT缺页曲线，结构与 lru_miss_ratio_curve 相同
+    """
+    pages, _ = translate_addresses(sequence, page_size)
+    next_use = build_next_use(pages)
+    if max_frames is None:
+        max_frames = max(len(set(pages)), 1)
+    stack = []  # 优先级栈中的页面，下标0为栈顶
+    priority = []  # 与 stack 对应的下次使用位置，越小优先级越高
+    hits_at_depth = [0] * (max_frames + 1)  # hits_at_depth[d] 为在深度 d 命中的次数
+    for t, page in enumerate(pages):
+        upcoming = next_use[t]
+        try:
+            depth = stack.index(page)
+            hits_at_depth[depth + 1] += 1
+        except ValueError:
+            depth = -1
+        if depth == 0:
+            priority[0] = upcoming
+            continue
+        if not stack:
+            stack.append(page)
+            priority.append(upcoming)
+            continue
+        carry_page, carry_priority = stack[0], priority[0]
+        stack[0], priority[0] = page, upcoming
+        for i in range(1, depth if depth > 0 else len(stack)):
+            if priority[i] > carry_priority:
+                stack[i], carry_page = carry_page, stack[i]
+                priority[i], carry_priority = carry_priority, priority[i]
+        if depth > 0:
+            stack[depth], priority[depth] = carry_page, carry_priority
+        elif len(stack) < max_frames:
+            stack.append(carry_page)
+            priority.append(carry_priority)
+    page_faults = [0] * max_frames
+    misses = len(pages)
+    for frames in range(1, max_frames + 1):
+        misses -= hits_at_depth[frames]
+        page_faults[frames - 1] = misses
+    return MissRatioCurve('OPT', len(pages), page_faults)
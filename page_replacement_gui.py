@@ -0,0 +1,1236 @@
+"""
+页面置换算法的Tkinter可视化界面
+
+包含算法选择窗口和逐步动画演示。模拟器核心位于 page_replacement_core，
+只做计算的脚本不需要导入本模块。
+"""
+import queue
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox
+
+from fault_rate_chart import FaultRateChart
+from page_replacement_core import (NO_VICTIM, PageReplacementSimulator, ReplayTimeline, calculate_physical_address,
+                                   fault_rate_series, policy_names, simulate_pages, translate_addresses)
+from workloads import DEFAULT_ADDRESS_SPACE, WORKLOAD_LABELS, generate_workload
+
+
+class TkinterPageAnimation:
+    POLL_INTERVAL = 50  # 轮询后台计算结果的间隔（毫秒）
+    CHECKPOINT_INTERVAL = 1024  # 时间轴定位使用的快照间隔（步数）
+    LARGE_BLOCK_LIMIT = 5  # 内存块不超过此数时画成一行大方块
+    GRID_COLUMNS = 16  # 内存块较多时网格每行的格子数
+    GRID_VISIBLE_ROWS = 3  # 网格可见的行数，其余行通过滚动条查看
+    TURBO_FPS = 30  # 极速播放的目标帧率
+    ALGORITHM_COLUMNS = 4  # 算法选择区域每行的单选按钮数
+    MAX_TURBO_BATCH = 1 << 20  # 极速播放每帧最多推进的步数
+
+    def __init__(self, simulator):
+        """
+        使用Tkinter的页面置换算法动画演示类
+        
+        Args:
+            simulator: PageReplacementSimulator实例
+        """
+        self.simulator = simulator
+        self.root = None
+        self.canvas = None
+        self.current_step = 0
+        self.animation_speed = 1000  # 毫秒
+        self.is_running = False
+        self.pending_after = None  # 尚未执行的动画回调（root.after 返回的id）
+        self.turbo_batch = 1  # 极速播放时每帧推进的步数，按实际耗时自适应
+        self.turbo_frame_started = None  # 上一帧开始的时间，用于估算播放速度
+        self.timeline = None  # 时间轴定位用的快照（ReplayTimeline）
+        self.block_items = None  # 各可见格子的 (背景框, 块号文字, 页面文字) 图形项
+        self.calculation_thread = None  # 后台计算线程
+        self.calculation_queue = None  # 后台计算结果队列，为None表示没有进行中的计算
+        self.cancel_event = None  # 通知后台线程取消计算
+        self.calculation_params = None
+        self.algorithm_type = None
+        self.algorithm_faults = {}  # 算法名称 -> 最近一次计算的缺页次数
+        self.calculated_series = {}  # 正在进行的计算中各算法的缺页率曲线
+        self.chart_series = {}  # 当前模拟器上已得到的缺页率曲线：算法名称 -> (步号列表, 缺页率列表)
+        self.chart_queue = None  # 后台计算缺页率曲线的结果队列，为None表示没有进行中的计算
+        
+    @property
+    def policy(self):
+        """当前演示的算法名称（未选择时取第一个注册的算法，即FIFO）"""
+        return self.algorithm_type or policy_names()[0]
+
+    def get_replay_log(self):
+        """
+        获取当前算法的事件记录
+        
+        算法在动画开始前整体运行一次，记录每一步是否缺页、所在内存块和被置换页面，
+        播放时只按步号读取，每一帧的开销与算法和序列长度无关
+        
+        Returns:
+            EventLog: 见 PageReplacementSimulator.get_event_log
+        """
+        return self.simulator.get_event_log(self.policy)
+
+    def get_timeline(self):
+        """
+        获取当前事件记录上的时间轴（首次调用时按 CHECKPOINT_INTERVAL 建立快照）
+        
+        Returns:
+            ReplayTimeline: 可定位到任意一步的回放时间轴
+        """
+        events = self.get_replay_log()
+        if self.timeline is None or self.timeline.events is not events:
+            page_numbers = self.simulator.get_translated_sequence()[0]
+            self.timeline = ReplayTimeline(page_numbers, events, self.simulator.memory_blocks,
+                                           self.CHECKPOINT_INTERVAL)
+        return self.timeline
+        
+    def chart_policies(self):
+        """缺页率曲线上显示的算法：当前演示的算法，选择了全部算法时再加上其余算法"""
+        policies = [self.policy]
+        if hasattr(self, 'algorithm_var') and self.algorithm_var.get() == "all":
+            policies += [name for name in policy_names() if name != self.policy]
+        return policies
+    
+    def setup_fault_chart(self):
+        """
+        为动画窗口的缺页率曲线准备数据，曲线随播放进度逐步显示
+        
+        当前演示的算法本来就要用到事件记录，直接在界面线程中抽样；其余算法优先使用
+        性能计算时得到的曲线，没有的在后台线程中计算，完成后再补画，打开窗口时不会卡住界面。
+        """
+        self.fault_chart.clear()
+        self.fault_chart.set_total_steps(len(self.simulator.sequence))
+        missing = []
+        for policy in self.chart_policies():
+            if policy == self.policy:
+                self.chart_series[policy] = fault_rate_series(self.get_replay_log().faults)
+            elif policy not in self.chart_series:
+                missing.append(policy)
+                continue
+            self.fault_chart.set_series(policy, *self.chart_series[policy], show=False)
+        self.fault_chart.show_until(self.current_step - 1)
+        
+        if missing:
+            self.chart_queue = queue.Queue()
+            threading.Thread(target=self._chart_worker,
+                             args=(self.chart_queue, missing, self.simulator.get_translated_sequence()[0],
+                                   self.simulator.memory_blocks),
+                             daemon=True).start()
+            self.root.after(self.POLL_INTERVAL, self._poll_chart_series, self.chart_queue)
+    
+    @staticmethod
+    def _chart_worker(results, policies, pages, memory_blocks):
+        """
+        后台线程：依次计算各算法的缺页率曲线
+        
+        队列消息为 (算法名, (步号列表, 缺页率列表))，全部完成或出错后放入 None。
+        """
+        try:
+            for policy in policies:
+                events = simulate_pages(policy, pages, memory_blocks, record_events=True).events
+                results.put((policy, fault_rate_series(events.faults)))
+        finally:
+            results.put(None)
+    
+    def _poll_chart_series(self, results):
+        """在界面线程中把后台算好的曲线加到图表上，直到全部完成或窗口、模拟器已更换"""
+        if results is not self.chart_queue:
+            return
+        while True:
+            try:
+                message = results.get_nowait()
+            except queue.Empty:
+                self.root.after(self.POLL_INTERVAL, self._poll_chart_series, results)
+                return
+            if message is None:
+                self.chart_queue = None
+                return
+            policy, series = message
+            self.chart_series[policy] = series
+            self.fault_chart.set_series(policy, *series, show=False)
+            self.fault_chart.show_until(self.current_step - 1)
+        
+    def create_selection_window(self):
+        """创建算法选择界面"""
+        self.root = tk.Tk()
+        self.root.title("页面置换算法选择")
+        self.root.geometry("800x870")
+        self.root.configure(bg='#f0f0f0')
+        
+        # 创建主框架
+        main_frame = ttk.Frame(self.root)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # 标题
+        title_label = ttk.Label(main_frame, text="页面置换算法模拟器")
+        title_label.pack(pady=(0, 30))
+        
+        # 算法选择区域
+        algorithm_frame = ttk.LabelFrame(main_frame, text="选择算法", padding=20)
+        algorithm_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        self.algorithm_var = tk.StringVar(value="both")
+        
+        # 每个已注册的算法一个单选按钮，每行最多 ALGORITHM_COLUMNS 个
+        names = policy_names()
+        for index, name in enumerate(names):
+            ttk.Radiobutton(algorithm_frame, text=f"{name}算法", variable=self.algorithm_var,
+                            value=name.lower()).grid(row=index // self.ALGORITHM_COLUMNS,
+                                                     column=index % self.ALGORITHM_COLUMNS,
+                                                     sticky=tk.W, padx=(0, 20), pady=5)
+        ttk.Radiobutton(algorithm_frame, text="全部算法都执行", variable=self.algorithm_var,
+                        value="all").grid(row=(len(names) - 1) // self.ALGORITHM_COLUMNS + 1, column=0,
+                                          columnspan=self.ALGORITHM_COLUMNS, sticky=tk.W, pady=5)
+        
+        # 参数设置区域
+        params_frame = ttk.LabelFrame(main_frame, text="参数设置", padding=20)
+        params_frame.pack(fill=tk.X, pady=(0, 20))
+        
+        # 指令序列长度
+        ttk.Label(params_frame, text="指令序列长度:").pack(anchor=tk.W)
+        self.sequence_length_var = tk.IntVar(value=320)
+        sequence_length_entry = ttk.Entry(params_frame, textvariable=self.sequence_length_var, width=10)
+        sequence_length_entry.pack(anchor=tk.W, pady=(5, 10))
+        
+        # 访问模式
+        ttk.Label(params_frame, text="访问模式:").pack(anchor=tk.W)
+        self.workload_var = tk.StringVar(value=WORKLOAD_LABELS['permutation'])
+        workload_combobox = ttk.Combobox(params_frame, textvariable=self.workload_var, state='readonly',
+                                         values=list(WORKLOAD_LABELS.values()), width=24)
+        workload_combobox.pack(anchor=tk.W, pady=(5, 10))
+        
+        # 内存块数
+        ttk.Label(params_frame, text="内存块数:").pack(anchor=tk.W)
+        self.memory_blocks_var = tk.IntVar(value=4)
+        memory_blocks_entry = ttk.Entry(params_frame, textvariable=self.memory_blocks_var, width=10)
+        memory_blocks_entry.pack(anchor=tk.W, pady=(5, 10))
+        
+        # 页大小
+        ttk.Label(params_frame, text="页大小:").pack(anchor=tk.W)
+        self.page_size_var = tk.IntVar(value=10)
+        page_size_entry = ttk.Entry(params_frame, textvariable=self.page_size_var, width=10)
+        page_size_entry.pack(anchor=tk.W, pady=(5, 10))
+        
+        # 结果显示区域
+        results_frame = ttk.LabelFrame(main_frame, text="计算结果", padding=20)
+        results_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 20))
+        
+        # 创建结果显示的文本框
+        self.results_text = tk.Text(results_frame, height=10, font=('Arial', 10), wrap=tk.WORD)
+        scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.results_text.yview)
+        self.results_text.configure(yscrollcommand=scrollbar.set)
+        
+        self.results_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # 缺页率曲线：选定的算法画在同一坐标轴上
+        chart_canvas = tk.Canvas(main_frame, width=740, height=160, bg='white', highlightthickness=0)
+        chart_canvas.pack(fill=tk.X, pady=(0, 10))
+        self.results_chart = FaultRateChart(chart_canvas, 740, 160)
+        
+        # 按钮区域
+        button_frame = ttk.Frame(main_frame)
+        button_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        self.calculate_button = ttk.Button(button_frame, text="计算算法性能", 
+                                         command=self.calculate_algorithms)
+        self.calculate_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.animate_button = ttk.Button(button_frame, text="启动动画演示", 
+                                       command=self.start_animation_demo)
+        self.animate_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.cancel_button = ttk.Button(button_frame, text="取消计算", 
+                                      command=self.cancel_calculation, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.clear_button = ttk.Button(button_frame, text="清空结果", 
+                                     command=self.clear_results)
+        self.clear_button.pack(side=tk.LEFT)
+        
+        # 初始化结果显示
+        self.results_text.insert(tk.END, "请选择算法并点击'计算算法性能'按钮开始计算...\n")
+        self.results_text.config(state=tk.DISABLED)
+        
+    def calculate_algorithms(self):
+        """计算选定算法的性能（在后台线程中进行，界面保持响应）"""
+        try:
+            # 获取参数（Tk变量只能在界面线程中读取）
+            sequence_length = self.sequence_length_var.get()
+            memory_blocks = self.memory_blocks_var.get()
+            page_size = self.page_size_var.get()
+            algorithm_choice = self.algorithm_var.get()
+            workload_label = self.workload_var.get()
+            workload = next(kind for kind, label in WORKLOAD_LABELS.items() if label == workload_label)
+        except Exception as e:
+            self.append_results(f"计算过程中出现错误: {str(e)}\n")
+            return
+
+        # 取消尚未完成的计算，旧线程的结果不再显示
+        self.cancel_calculation(announce=False)
+
+        # 清空结果显示
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.config(state=tk.DISABLED)
+        self.results_chart.clear()
+
+        # 显示参数信息
+        self.append_results(f"=== 参数设置 ===\n"
+                            f"指令序列长度: {sequence_length}\n"
+                            f"访问模式: {workload_label}\n"
+                            f"内存块数: {memory_blocks}\n"
+                            f"页大小: {page_size}\n"
+                            f"总页数: {-(-DEFAULT_ADDRESS_SPACE // page_size) if page_size else 0}\n"
+                            f"算法选择: {algorithm_choice}\n\n")
+
+        algorithms = [name for name in policy_names() if algorithm_choice in (name.lower(), "all")]
+        self.algorithm_faults = {}
+        self.calculated_series = {}
+        self.calculation_params = (sequence_length, memory_blocks, page_size, algorithm_choice)
+        self.calculation_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.calculation_thread = threading.Thread(
+            target=self._calculation_worker,
+            args=(self.calculation_queue, self.cancel_event, algorithms, workload, sequence_length, memory_blocks,
+                  page_size),
+            daemon=True)
+        self.calculate_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.calculation_thread.start()
+        self.root.after(self.POLL_INTERVAL, self._poll_calculation, self.calculation_queue)
+
+    @staticmethod
+    def _calculation_worker(results, cancel_event, algorithms, workload, sequence_length, memory_blocks, page_size):
+        """
+        后台线程：依次运行选定的算法，把进度和结果放入队列
+
+        队列消息为元组：('progress', 算法名)、('result', 算法名, 缺页次数, 缺页率曲线, 总步数)、
+        ('done', 逻辑地址序列) 或 ('error', 错误信息)。缺页率曲线也在后台线程中计算。
+        只在算法之间检查取消标志，取消后界面立即停止轮询，正在运行的那一个算法结束后线程随即退出。
+        """
+        try:
+            # 按所选访问模式生成新的序列，长度不受地址空间大小限制
+            new_sequence = generate_workload(workload, sequence_length)
+            # 批量地址转换，各算法共用同一页号序列
+            new_pages, _ = translate_addresses(new_sequence, page_size)
+            for algorithm in algorithms:
+                if cancel_event.is_set():
+                    return
+                results.put(('progress', algorithm))
+                result = simulate_pages(algorithm, new_pages, memory_blocks, record_events=True)
+                results.put(('result', algorithm, result.page_faults, fault_rate_series(result.events.faults),
+                             len(new_pages)))
+            results.put(('done', new_sequence))
+        except Exception as e:
+            results.put(('error', str(e)))
+
+    def _poll_calculation(self, results):
+        """在界面线程中取出后台计算的消息并显示，直到计算结束或被取消"""
+        if results is not self.calculation_queue:
+            return  # 已取消或已开始新的计算
+        sequence_length, memory_blocks, page_size, algorithm_choice = self.calculation_params
+        while True:
+            try:
+                message = results.get_nowait()
+            except queue.Empty:
+                self.root.after(self.POLL_INTERVAL, self._poll_calculation, results)
+                return
+            kind = message[0]
+            if kind == 'progress':
+                # 记录进度行的位置，结果到达后用结果替换这一行
+                self.results_text.mark_set('progress', 'end-1c')
+                self.results_text.mark_gravity('progress', tk.LEFT)
+                self.append_results(f"正在计算{message[1]}算法...\n")
+            elif kind == 'result':
+                self.calculated_series[message[1]] = message[3]
+                self.show_algorithm_result(message[1], message[2], sequence_length)
+                self.results_chart.set_total_steps(message[4])
+                self.results_chart.set_series(message[1], *message[3])
+            elif kind == 'done':
+                if algorithm_choice == "all":
+                    self.show_comparison()
+                # 更新模拟器实例
+                self.simulator = PageReplacementSimulator(
+                    total_instructions=sequence_length,
+                    page_size=page_size,
+                    memory_blocks=memory_blocks,
+                    sequence=message[1]
+                )
+                # 计算时得到的缺页率曲线正是新模拟器上的曲线，动画窗口直接复用
+                self.chart_series = self.calculated_series
+                self.reset_playback()
+                self.finish_calculation()
+                return
+            else:
+                self.append_results(f"计算过程中出现错误: {message[1]}\n")
+                self.finish_calculation()
+                return
+
+    def show_algorithm_result(self, algorithm, faults, sequence_length):
+        """显示单个算法的计算结果"""
+        self.algorithm_faults[algorithm] = faults
+        rate = (faults / sequence_length) * 100 if sequence_length else 0.0
+        # 用结果替换“正在计算”的进度行
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete('progress', 'end-1c')
+        self.results_text.config(state=tk.DISABLED)
+        self.append_results(f"=== {algorithm}算法结果 ===\n"
+                            f"缺页次数: {faults}\n"
+                            f"缺页率: {rate:.2f}%\n\n")
+
+    def show_comparison(self):
+        """全部算法都执行时显示性能比较"""
+        results = self.algorithm_faults
+        self.append_results("=== 算法性能比较 ===\n"
+                            + "".join(f"{name}算法缺页次数: {faults}\n" for name, faults in results.items())
+                            + "\n")
+
+        # 找出最优算法（缺页次数相同时一并列出）
+        min_faults = min(results.values())
+        best_algorithms = "、".join(f"{name}算法" for name, faults in results.items() if faults == min_faults)
+        self.append_results(f"最优算法: {best_algorithms} (缺页次数: {min_faults})\n\n")
+
+        # 计算各算法相对于最优算法的性能
+        for name, faults in results.items():
+            if faults > min_faults:
+                degradation = ((faults - min_faults) / faults) * 100
+                self.append_results(f"{name}算法相比最优算法增加了 {degradation:.2f}% 的缺页\n")
+
+    def cancel_calculation(self, announce=True):
+        """取消正在进行的计算"""
+        if self.calculation_queue is None:
+            return
+        self.cancel_event.set()
+        self.finish_calculation()
+        if announce:
+            self.append_results("计算已取消\n")
+
+    def finish_calculation(self):
+        """计算结束（完成、出错或取消）后恢复按钮状态"""
+        self.calculation_queue = None
+        self.calculate_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+
+    def append_results(self, text):
+        """在结果区域末尾追加文本"""
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.insert(tk.END, text)
+        self.results_text.see(tk.END)
+        self.results_text.config(state=tk.DISABLED)
+    
+    def clear_results(self):
+        """清空结果显示"""
+        self.results_text.config(state=tk.NORMAL)
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, "请选择算法并点击'计算算法性能'按钮开始计算...\n")
+        self.results_text.config(state=tk.DISABLED)
+    
+    def start_animation_demo(self):
+        """启动动画演示"""
+        algorithm_choice = self.algorithm_var.get()
+        
+        if algorithm_choice == "all":
+            # 创建选择窗口
+            self.create_animation_selection_window()
+            return
+        for name in policy_names():
+            if algorithm_choice == name.lower():
+                self.open_animation(name)
+                return
+        tk.messagebox.showwarning("警告", "请先选择算法！")
+    
+    def open_animation(self, algorithm):
+        """
+        打开指定算法的动画窗口并进入事件循环
+        
+        Args:
+            algorithm: 已注册的算法名称
+        """
+        # 上一个动画窗口的播放进度和内存状态不能带入新窗口
+        self.reset_playback()
+        self.simulator.reset()
+        self.algorithm_type = algorithm
+        self.create_window(f"{algorithm}页面置换算法动画演示")
+        self.draw_memory_blocks()
+        self.root.mainloop()
+    
+    def create_animation_selection_window(self):
+        """创建动画选择窗口"""
+        names = policy_names()
+        animation_window = tk.Toplevel(self.root)
+        animation_window.title("选择动画演示算法")
+        animation_window.geometry(f"400x{200 + 50 * len(names)}")
+        animation_window.configure(bg='#f0f0f0')
+        
+        # 主框架
+        main_frame = ttk.Frame(animation_window)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        
+        # 标题
+        title_label = ttk.Label(main_frame, text="选择要演示的算法")
+        title_label.pack(pady=(0, 30))
+        
+        # 每个已注册的算法一个按钮
+        for name in names:
+            ttk.Button(main_frame, text=f"{name}算法动画",
+                       command=lambda name=name: self.start_specific_animation(name, animation_window)).pack(pady=10)
+        
+        # 关闭按钮
+        close_button = ttk.Button(main_frame, text="关闭", 
+                                command=animation_window.destroy)
+        close_button.pack(pady=20)
+    
+    def start_specific_animation(self, algorithm, window):
+        """启动特定的算法动画"""
+        window.destroy()
+        self.open_animation(algorithm)
+
+    def create_window(self, title="页面置换算法动画演示"):
+        """创建动画窗口"""
+        self.root = tk.Tk()
+        self.root.title(title)
+        self.root.geometry("1200x980")  # 增加窗口大小
+        self.root.configure(bg='#f0f0f0')
+        
+        # 创建主框架
+        main_frame = ttk.Frame(self.root)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # 标题
+        title_label = ttk.Label(main_frame, text=title, font=('Arial', 16, 'bold'))
+        title_label.pack(pady=(0, 20))
+        
+        # 创建画布
+        self.canvas = tk.Canvas(main_frame, width=1150, height=500, bg='white', 
+                              relief=tk.RAISED, bd=2)
+        self.canvas.pack(pady=(0, 10))
+        self.block_items = None  # 常驻图形项在首次绘制时创建
+        
+        # 缺页率曲线，随播放进度逐步显示
+        chart_canvas = tk.Canvas(main_frame, width=1150, height=160, bg='white', highlightthickness=0)
+        chart_canvas.pack(pady=(0, 10))
+        self.fault_chart = FaultRateChart(chart_canvas, 1150, 160)
+        
+        # 控制面板
+        control_frame = ttk.Frame(main_frame)
+        control_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        # 进度条
+        self.progress_var = tk.DoubleVar()
+        self.progress_bar = ttk.Progressbar(control_frame, variable=self.progress_var, 
+                                          maximum=len(self.simulator.sequence))
+        self.progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 10))
+        
+        # 控制按钮
+        button_frame = ttk.Frame(control_frame)
+        button_frame.pack(side=tk.RIGHT)
+        
+        self.start_button = ttk.Button(button_frame, text="开始", command=self.start_animation)
+        self.start_button.pack(side=tk.LEFT, padx=2)
+        
+        self.pause_button = ttk.Button(button_frame, text="暂停", command=self.pause_animation, state=tk.DISABLED)
+        self.pause_button.pack(side=tk.LEFT, padx=2)
+        
+        self.reset_button = ttk.Button(button_frame, text="重置", command=self.reset_animation)
+        self.reset_button.pack(side=tk.LEFT, padx=2)
+        
+        # 时间轴：拖动定位到任意一步，或逐步前进/后退
+        timeline_frame = ttk.Frame(main_frame)
+        timeline_frame.pack(fill=tk.X, pady=(0, 10))
+        
+        ttk.Label(timeline_frame, text="时间轴:").pack(side=tk.LEFT)
+        self.step_back_button = ttk.Button(timeline_frame, text="◀ 上一步", command=self.step_backward)
+        self.step_back_button.pack(side=tk.LEFT, padx=(10, 2))
+        self.step_forward_button = ttk.Button(timeline_frame, text="下一步 ▶", command=self.step_forward)
+        self.step_forward_button.pack(side=tk.LEFT, padx=2)
+        self.timeline_scale = ttk.Scale(timeline_frame, from_=0, to=len(self.simulator.sequence),
+                                        variable=self.progress_var, orient=tk.HORIZONTAL,
+                                        command=self.seek)
+        self.timeline_scale.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(10, 0))
+        
+        # 速度控制
+        speed_frame = ttk.Frame(main_frame)
+        speed_frame.pack(fill=tk.X)
+        
+        ttk.Label(speed_frame, text="动画速度:").pack(side=tk.LEFT)
+        self.speed_var = tk.IntVar(value=1000)
+        speed_scale = ttk.Scale(speed_frame, from_=100, to=3000, variable=self.speed_var, 
+                               orient=tk.HORIZONTAL, length=200)
+        speed_scale.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # 极速播放：每帧推进多步，只绘制帧末的状态
+        self.turbo_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(speed_frame, text="极速播放", variable=self.turbo_var).pack(side=tk.LEFT, padx=(20, 0))
+        
+        # 信息显示区域
+        info_frame = ttk.Frame(main_frame)
+        info_frame.pack(fill=tk.X, pady=(10, 0))
+        
+        # 创建信息标签
+        self.info_labels = {}
+        info_items = [
+            ('current_instruction', '当前指令:'),
+            ('logical_address', '逻辑地址:'),
+            ('page_number', '页号:'),
+            ('page_offset', '页内地址:'),
+            ('memory_status', '内存状态:'),
+            ('page_faults', '缺页次数:'),
+            ('status', '状态:'),
+            ('action', '操作:'),
+            ('physical_address', '物理地址:'),
+            ('address_conversion', '地址转换:')
+        ]
+        
+        for i, (key, text) in enumerate(info_items):
+            row = i // 2
+            col = i % 2
+            
+            frame = ttk.Frame(info_frame)
+            frame.grid(row=row, column=col, sticky='ew', padx=5, pady=2)
+            
+            ttk.Label(frame, text=text, font=('Arial', 10, 'bold')).pack(side=tk.LEFT)
+            label = ttk.Label(frame, text='-', font=('Arial', 10))
+            label.pack(side=tk.LEFT, padx=(5, 0))
+            self.info_labels[key] = label
+        
+        # 配置网格权重
+        info_frame.columnconfigure(0, weight=1)
+        info_frame.columnconfigure(1, weight=1)
+        
+        # 预先运行一次算法生成事件记录并建立时间轴快照，播放时只按步号读取
+        self.get_timeline()
+        self.setup_fault_chart()
+        
+    def layout_memory_view(self):
+        """
+        计算内存块视图的布局
+        
+        内存块不多时沿用一行大方块；较多时改为每行 GRID_COLUMNS 个小方格的网格，
+        只显示 GRID_VISIBLE_ROWS 行，其余通过滚动条查看
+        """
+        frames = self.simulator.memory_blocks
+        self.large_blocks = frames <= self.LARGE_BLOCK_LIMIT
+        if self.large_blocks:
+            self.block_width, self.block_height, self.block_gap = 180, 100, 30
+            self.block_columns, self.visible_rows = max(frames, 1), 1
+        else:
+            self.block_width, self.block_height, self.block_gap = 60, 30, 6
+            self.block_columns, self.visible_rows = self.GRID_COLUMNS, self.GRID_VISIBLE_ROWS
+        self.block_rows = -(-frames // self.block_columns)  # 网格总行数
+        self.first_row = 0  # 第一行可见格子所在的网格行
+    
+    def block_origin(self, cell_index):
+        """第cell_index个可见格子左上角在画布上的坐标"""
+        start_x = 50
+        start_y = 60
+        row, column = divmod(cell_index, self.block_columns)
+        return (start_x + column * (self.block_width + self.block_gap), 
+                start_y + row * (self.block_height + self.block_gap // 2))
+    
+    def block_cell(self, frame_number):
+        """内存块对应的可见格子序号，当前未显示时返回 None"""
+        cell_index = frame_number - self.first_row * self.block_columns
+        if 0 <= cell_index < len(self.block_items):
+            return cell_index
+        return None
+
+    def create_canvas_items(self):
+        """
+        创建画布上的常驻图形项
+        
+        内存块、地址转换区域、高亮框和提示信息都只创建一次，之后每一步用 itemconfig
+        修改文字和颜色，画布上的图形项数量不随步数增长。内存块只为可见的格子创建
+        图形项，滚动时把这些格子重新对应到别的内存块，因此与内存块总数无关
+        """
+        self.canvas.delete("all")
+        self.layout_memory_view()
+        
+        # 内存块标题
+        self.canvas.create_text(575, 30, text="内存块状态", font=('Arial', 14, 'bold'), 
+                              fill='#333333', tags="memory_blocks")
+        
+        # 绘制可见的内存块格子（初始均为空闲）
+        large = self.large_blocks
+        label_font = ('Arial', 10, 'bold') if large else ('Arial', 7)
+        cells = min(self.simulator.memory_blocks, self.block_columns * self.visible_rows)
+        self.block_items = []
+        for i in range(cells):
+            x, y = self.block_origin(i)
+            rect = self.canvas.create_rectangle(x, y, x + self.block_width, y + self.block_height, 
+                                                fill='#f5f5f5', outline='#cccccc', 
+                                                width=2 if large else 1, tags="memory_blocks")
+            
+            # 块号
+            label = self.canvas.create_text(x + self.block_width//2, y + (20 if large else 8), 
+                                            text="", font=label_font, 
+                                            fill='#666666', tags="memory_blocks")
+            
+            # 页面内容
+            content = self.canvas.create_text(x + self.block_width//2, y + (self.block_height//2 if large else 20), 
+                                              text="", tags="memory_blocks")
+            self.block_items.append((rect, label, content))
+        self.block_cells = [None] * cells  # 各格子当前显示的 (内存块号, 页号)
+        
+        # 内存块较多时在网格右侧放置滚动条
+        if self.block_rows > self.visible_rows:
+            self.block_scrollbar = ttk.Scrollbar(self.canvas, orient=tk.VERTICAL, command=self.scroll_memory_view)
+            grid_height = self.visible_rows * (self.block_height + self.block_gap // 2)
+            self.canvas.create_window(1125, 60, window=self.block_scrollbar, anchor=tk.N, 
+                                      height=grid_height, tags="memory_blocks")
+            self.update_memory_scrollbar()
+        
+        # 命中高亮框和标记，平时隐藏，命中时移动到对应内存块
+        self.highlight_rect = self.canvas.create_rectangle(0, 0, 0, 0, outline='#FF5722', width=3, 
+                                                           state=tk.HIDDEN, tags="highlight")
+        self.highlight_mark = self.canvas.create_text(0, 0, text="✓", font=('Arial', 16, 'bold'), 
+                                                      fill='#4CAF50', state=tk.HIDDEN, tags="highlight")
+        
+        # 绘制地址转换区域
+        self.draw_address_conversion_area()
+        
+        # 提示信息：图标、标题和两行说明
+        self.message_items = (
+            self.canvas.create_text(575, 380, text="", font=('Arial', 48), tags="message"),
+            self.canvas.create_text(575, 430, text="", font=('Arial', 16, 'bold'), tags="message"),
+            self.canvas.create_text(575, 460, text="", font=('Arial', 12), fill='#666666', tags="message"),
+            self.canvas.create_text(575, 480, text="", font=('Arial', 12), fill='#666666', tags="message"),
+        )
+    
+    def draw_memory_blocks(self):
+        """更新内存块显示（只修改可见且内容发生变化的格子）"""
+        if self.block_items is None:
+            self.create_canvas_items()
+        
+        large = self.large_blocks
+        first_frame = self.first_row * self.block_columns
+        for i, (rect, label, content) in enumerate(self.block_items):
+            frame_number = first_frame + i
+            if frame_number >= self.simulator.memory_blocks:
+                # 最后一行不满时隐藏多出的格子
+                if self.block_cells[i] is not None:
+                    self.block_cells[i] = None
+                    for item in (rect, label, content):
+                        self.canvas.itemconfig(item, state=tk.HIDDEN)
+                continue
+            page_num = self.simulator.memory[frame_number]
+            if self.block_cells[i] == (frame_number, page_num):
+                continue
+            if self.block_cells[i] is None or self.block_cells[i][0] != frame_number:
+                for item in (rect, label, content):
+                    self.canvas.itemconfig(item, state=tk.NORMAL)
+                self.canvas.itemconfig(label, text=f"内存块 {frame_number}" if large else f"#{frame_number}")
+            self.block_cells[i] = (frame_number, page_num)
+            
+            if page_num is not None:
+                # 有页面的块：浅绿色背景，绿色边框
+                self.canvas.itemconfig(rect, fill='#e8f5e8', outline='#4CAF50')
+                self.canvas.itemconfig(content, text=f"页面 {page_num}" if large else str(page_num), 
+                                       font=('Arial', 12, 'bold') if large else ('Arial', 9, 'bold'), 
+                                       fill='#2E7D32')
+            else:
+                # 空块：浅灰色背景，灰色边框
+                self.canvas.itemconfig(rect, fill='#f5f5f5', outline='#cccccc')
+                self.canvas.itemconfig(content, text="空闲", font=('Arial', 10) if large else ('Arial', 8), 
+                                       fill='#999999')
+    
+    def scroll_memory_view(self, action, amount, unit=None):
+        """
+        滚动条回调：滚动内存块网格
+        
+        Args:
+            action: 'moveto'（amount 为位置比例）或 'scroll'（amount 为行数或页数）
+            amount: 见 action
+            unit: 'units' 按行滚动，'pages' 按屏滚动
+        """
+        if action == 'moveto':
+            first_row = round(float(amount) * self.block_rows)
+        else:
+            first_row = self.first_row + int(amount) * (self.visible_rows if unit == 'pages' else 1)
+        first_row = max(0, min(first_row, self.block_rows - self.visible_rows))
+        if first_row == self.first_row:
+            return
+        self.first_row = first_row
+        self.update_memory_scrollbar()
+        self.draw_memory_blocks()
+        self.clear_highlight()
+    
+    def update_memory_scrollbar(self):
+        """让滚动条滑块与当前可见的网格行一致"""
+        self.block_scrollbar.set(self.first_row / self.block_rows, 
+                                 (self.first_row + self.visible_rows) / self.block_rows)
+    
+    def draw_address_conversion_area(self):
+        """绘制地址转换区域"""
+        # 地址转换区域标题
+        self.canvas.create_text(575, 200, text="地址转换过程", font=('Arial', 14, 'bold'), 
+                              fill='#333333', tags="address_area")
+        
+        # 绘制地址转换流程图
+        # 逻辑地址框
+        self.canvas.create_rectangle(50, 220, 220, 280, fill='#E3F2FD', outline='#2196F3', 
+                                   width=2, tags="address_area")
+        self.canvas.create_text(135, 235, text="逻辑地址", font=('Arial', 10, 'bold'), 
+                              fill='#1976D2', tags="address_area")
+        self.logical_addr_text = self.canvas.create_text(135, 255, text="", 
+                                                       font=('Arial', 12), fill='#1976D2', 
+                                                       tags="address_area")
+        
+        # 箭头1
+        self.canvas.create_text(245, 250, text="→", font=('Arial', 16, 'bold'), 
+                              fill='#666666', tags="address_area")
+        
+        # 页号框
+        self.canvas.create_rectangle(270, 220, 370, 280, fill='#FFF3E0', outline='#FF9800', 
+                                   width=2, tags="address_area")
+        self.canvas.create_text(320, 235, text="页号", font=('Arial', 10, 'bold'), 
+                              fill='#E65100', tags="address_area")
+        self.page_num_text = self.canvas.create_text(320, 255, text="", 
+                                                   font=('Arial', 12), fill='#E65100', 
+                                                   tags="address_area")
+        
+        # 箭头2
+        self.canvas.create_text(395, 250, text="→", font=('Arial', 16, 'bold'), 
+                              fill='#666666', tags="address_area")
+        
+        # 内存块号框
+        self.canvas.create_rectangle(420, 220, 520, 280, fill='#E8F5E8', outline='#4CAF50', 
+                                   width=2, tags="address_area")
+        self.canvas.create_text(470, 235, text="内存块号", font=('Arial', 10, 'bold'), 
+                              fill='#2E7D32', tags="address_area")
+        self.frame_num_text = self.canvas.create_text(470, 255, text="", 
+                                                    font=('Arial', 12), fill='#2E7D32', 
+                                                    tags="address_area")
+        
+        # 箭头3
+        self.canvas.create_text(545, 250, text="→", font=('Arial', 16, 'bold'), 
+                              fill='#666666', tags="address_area")
+        
+        # 物理地址框
+        self.canvas.create_rectangle(570, 220, 720, 280, fill='#F3E5F5', outline='#9C27B0', 
+                                   width=2, tags="address_area")
+        self.canvas.create_text(645, 235, text="物理地址", font=('Arial', 10, 'bold'), 
+                              fill='#7B1FA2', tags="address_area")
+        self.physical_addr_text = self.canvas.create_text(645, 255, text="", 
+                                                        font=('Arial', 12), fill='#7B1FA2', 
+                                                        tags="address_area")
+        
+        # 页内地址框
+        self.canvas.create_rectangle(745, 220, 845, 280, fill='#FFF8E1', outline='#FFC107', 
+                                   width=2, tags="address_area")
+        self.canvas.create_text(795, 235, text="页内地址", font=('Arial', 10, 'bold'), 
+                              fill='#F57F17', tags="address_area")
+        self.page_offset_text = self.canvas.create_text(795, 255, text="", 
+                                                      font=('Arial', 12), fill='#F57F17', 
+                                                      tags="address_area")
+        
+        # 公式说明
+        self.canvas.create_text(575, 310, text="物理地址 = 内存块号 × 页大小 + 页内地址", 
+                              font=('Arial', 10), fill='#666666', tags="address_area")
+        
+        # 本步转换结果说明
+        self.conversion_text = self.canvas.create_text(575, 350, text="", font=('Arial', 12, 'bold'), 
+                                                       tags="address_area")
+    
+    def clear_address_conversion(self):
+        """清空地址转换区域中的数值"""
+        for item in (self.logical_addr_text, self.page_num_text, self.frame_num_text, 
+                     self.physical_addr_text, self.page_offset_text, self.conversion_text):
+            self.canvas.itemconfig(item, text="")
+    
+    def update_address_conversion(self, logical_address, page_number, page_offset, step):
+        """更新地址转换显示（第step步的决策取自事件记录）"""
+        # 更新逻辑地址
+        self.canvas.itemconfig(self.logical_addr_text, text=str(logical_address))
+        
+        # 更新页号
+        self.canvas.itemconfig(self.page_num_text, text=str(page_number))
+        
+        # 更新页内地址
+        self.canvas.itemconfig(self.page_offset_text, text=str(page_offset))
+        
+        fault, frame_number, victim_page = self.get_replay_log()[step]
+        if not fault:
+            # 页面在内存中，计算物理地址
+            physical_address = calculate_physical_address(page_offset, frame_number, self.simulator.page_size)
+            
+            # 更新内存块号
+            self.canvas.itemconfig(self.frame_num_text, text=str(frame_number))
+            
+            # 更新物理地址
+            self.canvas.itemconfig(self.physical_addr_text, text=str(physical_address))
+            
+            # 高亮显示转换过程
+            self.canvas.itemconfig(self.conversion_text, text=f"✓ 页面命中：逻辑地址{logical_address} → 物理地址{physical_address}", 
+                                   fill='#4CAF50')
+        else:
+            # 页面不在内存中
+            self.canvas.itemconfig(self.frame_num_text, text="缺页")
+            self.canvas.itemconfig(self.physical_addr_text, text="无法计算")
+            
+            if victim_page != NO_VICTIM:
+                # 显示置换信息
+                self.canvas.itemconfig(self.conversion_text, text=f"🔄 {self.policy}算法：置换页面{victim_page}，加载页面{page_number}", 
+                                       fill='#FF9800')
+            else:
+                # 显示加载信息
+                self.canvas.itemconfig(self.conversion_text, text=f"📥 页面加载：页面{page_number}加载到空闲块", 
+                                       fill='#4CAF50')
+    
+    def highlight_current_page(self, page_number):
+        """高亮显示当前访问的页面"""
+        block_index = self.simulator.memory.frame_of(page_number)
+        cell_index = None if block_index is None else self.block_cell(block_index)
+        if cell_index is None:
+            # 页面所在的内存块当前未显示
+            self.clear_highlight()
+            return
+        
+        # 把高亮框和命中标记移动到页面所在的内存块
+        block_width = self.block_width
+        block_height = self.block_height
+        x, y = self.block_origin(cell_index)
+        self.canvas.coords(self.highlight_rect, x-3, y-3, x + block_width+3, y + block_height+3)
+        self.canvas.coords(self.highlight_mark, x + block_width + 10, y + block_height//2)
+        self.canvas.itemconfig("highlight", state=tk.NORMAL)
+    
+    def clear_highlight(self):
+        """隐藏命中高亮"""
+        self.canvas.itemconfig("highlight", state=tk.HIDDEN)
+    
+    def show_message(self, icon, color, title, detail, extra=""):
+        """在提示区域显示图标、标题和说明文字"""
+        icon_item, title_item, detail_item, extra_item = self.message_items
+        self.canvas.itemconfig(icon_item, text=icon, fill=color)
+        self.canvas.itemconfig(title_item, text=title, fill=color)
+        self.canvas.itemconfig(detail_item, text=detail)
+        self.canvas.itemconfig(extra_item, text=extra)
+    
+    def clear_message(self):
+        """清空提示区域"""
+        self.canvas.itemconfig("message", text="")
+    
+    def show_page_check_animation(self, page_number):
+        """显示页面检查动画"""
+        self.show_message("🔍", '#2196F3', "正在检查页面...", f"检查页面 {page_number} 是否在内存中")
+    
+    def process_page_access(self):
+        """处理页面访问（按步号读取页号和预先计算的事件记录，不再重新选择被置换页面）"""
+        page_number = self.simulator.get_translated_sequence()[0][self.current_step]
+        fault, frame_number, victim_page = self.get_replay_log()[self.current_step]
+        if fault:
+            # 缺页处理
+            self.handle_page_fault(page_number, frame_number, victim_page)
+        else:
+            # 页面命中
+            self.handle_page_hit(page_number)
+        
+        # 更新显示
+        self.draw_memory_blocks()
+        self.update_info_display(self.current_step)
+        self.progress_var.set(self.current_step + 1)
+        self.fault_chart.show_until(self.current_step)
+        
+        self.current_step += 1
+        
+        # 继续下一步（暂停时停在当前步，之后可继续播放或在时间轴上定位）
+        self.pending_after = None
+        if self.current_step >= len(self.simulator.sequence):
+            self.animation_finished()
+        elif self.is_running:
+            self.continue_playback(self.speed_var.get())
+    
+    def handle_page_fault(self, page_number, frame_number, victim_page):
+        """处理缺页中断"""
+        if victim_page == NO_VICTIM:
+            # 还有空闲块
+            self.show_free_block_animation(page_number, frame_number)
+            self.simulator.memory.load(page_number)
+        else:
+            # 需要置换
+            self.show_page_replacement_animation(page_number, frame_number, victim_page)
+            self.simulator.memory.replace(victim_page, page_number)
+        
+        self.simulator.page_faults += 1
+    
+    def handle_page_hit(self, page_number):
+        """处理页面命中"""
+        self.show_page_hit_animation(page_number)
+    
+    def show_free_block_animation(self, page_number, free_block_index):
+        """显示空闲块加载动画"""
+        self.show_message("📥", '#4CAF50', "加载页面到空闲块", f"页面 {page_number} 加载到内存块 {free_block_index}")
+    
+    def show_page_replacement_animation(self, page_number, victim_index, victim_page):
+        """显示页面置换动画"""
+        self.show_message("🔄", '#FF9800', "页面置换过程", 
+                          f"{self.policy}算法：置换页面 {victim_page}，加载页面 {page_number}", 
+                          f"置换位置：内存块 {victim_index}")
+    
+    def show_page_hit_animation(self, page_number):
+        """显示页面命中动画"""
+        self.show_message("✅", '#4CAF50', "页面命中", f"页面 {page_number} 已在内存中，直接访问")
+    
+    def start_animation(self):
+        """开始动画"""
+        if not self.is_running:
+            # 暂停时尚未执行的回调（如页面检查的延迟）必须取消，否则会与新的播放同时推进
+            self.cancel_pending_step()
+            self.is_running = True
+            self.start_button.config(state=tk.DISABLED)
+            self.pause_button.config(state=tk.NORMAL)
+            self.turbo_batch = 1
+            self.turbo_frame_started = None
+            self.continue_playback(0)
+    
+    def continue_playback(self, delay):
+        """按当前的播放模式安排下一帧（极速播放可在播放中途切换）"""
+        if self.turbo_var.get():
+            self.pending_after = self.root.after(delay, self.turbo_step)
+        else:
+            self.pending_after = self.root.after(delay, self.step_animation)
+    
+    def apply_steps(self, start, stop):
+        """
+        按事件记录直接执行第 start 到 stop-1 步，不播放逐步动画
+        
+        Returns:
+            int: 这些步中的缺页次数
+        """
+        page_numbers = self.simulator.get_translated_sequence()[0]
+        events = self.get_replay_log()
+        memory = self.simulator.memory
+        faults = 0
+        for page_number, fault, victim_page in zip(page_numbers[start:stop], events.faults[start:stop], 
+                                                   events.victims[start:stop]):
+            if fault:
+                faults += 1
+                if victim_page == NO_VICTIM:
+                    memory.load(page_number)
+                else:
+                    memory.replace(victim_page, page_number)
+        self.simulator.page_faults += faults
+        return faults
+    
+    def turbo_step(self):
+        """
+        极速播放的一帧：推进 turbo_batch 步后只绘制一次
+        
+        推进步数控制在半帧时间内，其余时间留给绘制和界面事件；每帧根据实际耗时
+        调整步数，使帧率保持在 TURBO_FPS 附近。提示区域显示本帧和累计的缺页率。
+        """
+        self.pending_after = None
+        total = len(self.simulator.sequence)
+        if not self.is_running or self.current_step >= total:
+            return
+        frame_time = 1.0 / self.TURBO_FPS
+        started = time.perf_counter()
+        previous_started, self.turbo_frame_started = self.turbo_frame_started, started
+        
+        start = self.current_step
+        stop = min(start + self.turbo_batch, total)
+        batch_faults = self.apply_steps(start, stop)
+        elapsed = time.perf_counter() - started
+        # 每帧最多增大到4倍，避免计时抖动导致步数骤增
+        target = int(self.turbo_batch * (frame_time / 2) / elapsed) if elapsed > 0 else self.turbo_batch * 4
+        self.turbo_batch = max(1, min(target, self.turbo_batch * 4, self.MAX_TURBO_BATCH))
+        self.current_step = stop
+        
+        # 绘制帧末状态和汇总的计数
+        steps = stop - start
+        self.draw_memory_blocks()
+        self.update_info_display(stop - 1)
+        self.progress_var.set(stop)
+        self.fault_chart.show_until(stop - 1)
+        speed = f"，约 {steps / (started - previous_started):.0f} 步/秒" if previous_started else ""
+        self.show_message("⏩", '#673AB7', f"极速播放：本帧推进 {steps} 步", 
+                          f"本帧缺页 {batch_faults} 次，缺页率 {batch_faults / steps:.2%}", 
+                          f"累计缺页 {self.simulator.page_faults} 次，缺页率 {self.simulator.page_faults / stop:.2%}{speed}")
+        
+        if stop >= total:
+            self.animation_finished()
+        else:
+            self.continue_playback(max(1, int((frame_time - (time.perf_counter() - started)) * 1000)))
+    
+    def pause_animation(self):
+        """暂停动画"""
+        self.is_running = False
+        self.start_button.config(state=tk.NORMAL)
+        self.pause_button.config(state=tk.DISABLED)
+    
+    def reset_animation(self):
+        """重置动画"""
+        self.is_running = False
+        self.cancel_pending_step()
+        self.current_step = 0
+        self.simulator.reset()
+        self.progress_var.set(0)
+        self.fault_chart.show_until(-1)
+        self.start_button.config(state=tk.NORMAL)
+        self.pause_button.config(state=tk.DISABLED)
+        
+        # 清空画布上的提示、高亮和地址转换结果，内存块随模拟器一起回到空闲状态
+        self.draw_memory_blocks()
+        self.clear_message()
+        self.clear_highlight()
+        self.clear_address_conversion()
+        
+        # 重置信息显示
+        for label in self.info_labels.values():
+            label.config(text='-', foreground='black')
+    
+    def cancel_pending_step(self):
+        """取消尚未执行的动画回调，避免它在定位之后作用到错误的步骤上"""
+        if self.pending_after is not None:
+            try:
+                self.root.after_cancel(self.pending_after)
+            except tk.TclError:
+                pass  # 回调所属的动画窗口已关闭，回调不会再执行
+            self.pending_after = None
+    
+    def reset_playback(self):
+        """停止播放并回到第0步（打开新的动画窗口或更换模拟器时调用）"""
+        self.cancel_pending_step()
+        self.is_running = False
+        self.current_step = 0
+        self.timeline = None
+        self.chart_queue = None  # 尚未画完的曲线属于旧窗口或旧模拟器，不再补画
+    
+    def seek(self, step):
+        """
+        定位到执行完前step条指令后的状态
+        
+        从最近的快照出发按事件记录重放，不经过逐帧动画，百万步的序列也只需毫秒级时间
+        
+        Args:
+            step: 已执行的指令数（时间轴传入的可能是字符串形式的小数）
+        """
+        total = len(self.simulator.sequence)
+        step = max(0, min(int(float(step)), total))
+        if self.is_running:
+            self.pause_animation()
+        self.cancel_pending_step()
+        
+        self.simulator.memory, self.simulator.page_faults = self.get_timeline().state_at(step)
+        self.current_step = step
+        self.progress_var.set(step)
+        self.fault_chart.show_until(step - 1)
+        self.start_button.config(state=tk.NORMAL if step < total else tk.DISABLED)
+        
+        # 清除提示和高亮，更新内存块并显示最后执行的一步
+        self.draw_memory_blocks()
+        self.clear_message()
+        self.clear_highlight()
+        if step > 0:
+            self.update_info_display(step - 1)
+        else:
+            self.clear_address_conversion()
+            for label in self.info_labels.values():
+                label.config(text='-', foreground='black')
+    
+    def step_backward(self):
+        """后退一步"""
+        self.seek(self.current_step - 1)
+    
+    def step_forward(self):
+        """前进一步（直接显示结果，不播放检查动画）"""
+        self.seek(self.current_step + 1)
+    
+    def animation_finished(self):
+        """动画完成"""
+        self.is_running = False
+        self.start_button.config(state=tk.DISABLED)
+        self.pause_button.config(state=tk.DISABLED)
+        
+        # 显示完成信息
+        self.show_message("✓", '#4CAF50', "动画演示完成", f"总缺页次数: {self.simulator.page_faults}")
+    
+    def animate(self, algorithm):
+        """
+        从头演示指定算法的动画
+        
+        Args:
+            algorithm: 已注册的算法名称
+        
+        Returns:
+            int: 窗口关闭时的缺页次数
+        """
+        self.simulator.reset()
+        self.open_animation(algorithm)
+        return self.simulator.page_faults
+    
+    def animate_fifo(self):
+        """FIFO算法动画"""
+        return self.animate('FIFO')
+    
+    def animate_opt(self):
+        """OPT算法动画"""
+        return self.animate('OPT')
+
+    def animate_lru(self):
+        """LRU算法动画"""
+        return self.animate('LRU')
+
+    def update_info_display(self, step):
+        """更新信息显示（第step步的决策取自事件记录）"""
+        if step >= len(self.simulator.sequence):
+            return
+            
+        logical_address = self.simulator.sequence[step]
+        page_numbers, page_offsets = self.simulator.get_translated_sequence()
+        page_number, page_offset = page_numbers[step], page_offsets[step]
+        
+        # 更新信息标签
+        self.info_labels['current_instruction'].config(text=f"{step}")
+        self.info_labels['logical_address'].config(text=f"{logical_address}")
+        self.info_labels['page_number'].config(text=f"{page_number}")
+        self.info_labels['page_offset'].config(text=f"{page_offset}")
+        if self.simulator.memory_blocks <= self.GRID_COLUMNS:
+            self.info_labels['memory_status'].config(text=str(self.simulator.memory))
+        else:
+            # 内存块很多时不逐个列出页面，避免每一步生成很长的字符串
+            self.info_labels['memory_status'].config(
+                text=f"已占用 {len(self.simulator.memory)}/{self.simulator.memory_blocks} 个内存块")
+        self.info_labels['page_faults'].config(text=f"{self.simulator.page_faults}")
+        
+        fault, frame_number, victim_page = self.get_replay_log()[step]
+        if fault:
+            self.clear_highlight()
+            self.info_labels['physical_address'].config(text="无法计算")
+            self.info_labels['address_conversion'].config(text="页面不在内存中")
+            
+            # 显示详细的操作信息
+            if victim_page == NO_VICTIM:
+                self.info_labels['status'].config(text="页面加载中", foreground='blue')
+                self.info_labels['action'].config(text=f"加载页面 {page_number} 到空闲块")
+            else:
+                self.info_labels['status'].config(text="页面置换中", foreground='orange')
+                self.info_labels['action'].config(text=f"{self.policy}: 置换页面{victim_page}，加载页面{page_number}到内存块{frame_number}")
+        else:
+            # 页面命中，计算物理地址
+            physical_address = calculate_physical_address(page_offset, frame_number, self.simulator.page_size)
+            
+            self.info_labels['status'].config(text="页面命中", foreground='green')
+            self.info_labels['physical_address'].config(text=f"{physical_address}")
+            self.info_labels['address_conversion'].config(text=f"内存块{frame_number} × {self.simulator.page_size} + {page_offset} = {physical_address}")
+            self.info_labels['action'].config(text="直接访问")
+            self.highlight_current_page(page_number)
+        
+        # 更新地址转换可视化
+        self.update_address_conversion(logical_address, page_number, page_offset, step)
+    
+    def step_animation(self):
+        """执行一步动画"""
+        if self.current_step >= len(self.simulator.sequence) or not self.is_running:
+            return
+        
+        # 执行算法步骤
+        page_number = self.simulator.get_translated_sequence()[0][self.current_step]
+        
+        # 先显示页面检查过程
+        self.show_page_check_animation(page_number)
+        
+        # 延迟显示结果（检查过程的停留时间随动画速度缩放，默认速度下为800毫秒）
+        check_delay = max(1, self.speed_var.get() * 4 // 5)
+        self.pending_after = self.root.after(check_delay, self.process_page_access)
@@ -0,0 +1,249 @@
+"""
+参数扫描：在 算法 × 内存块数 × 页大小 × 随机种子 的网格上并行运行模拟
+
+每个访问序列只写入一次共享内存，各工作进程按名字挂载读取，任务本身只携带参数，
+不会为每个任务重复序列化整个序列。结果汇总为一张表，可输出为CSV或JSON。
+
+用法示例：
+    python sweep.py --algorithms FIFO OPT LRU --frames 1-64 --page-sizes 10 20 --seeds 1-8
+    python sweep.py --trace trace.pgtrace --frames 16 32 64 128 --format json
+    python sweep.py --workload working-set --length 1000000 --address-space 65536 --frames 8-256:8 --seeds 1-4
+"""
+import argparse
+import contextlib
+import csv
+import itertools
+import json
+import os
+import sys
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory, util
+
+from page_replacement_core import policy_names, simulate_pages, translate_addresses
+from workloads import DEFAULT_ADDRESS_SPACE, WORKLOAD_LABELS, generate_workload
+
+SweepRow = namedtuple('SweepRow', ['algorithm', 'memory_blocks', 'page_size', 'seed',
+                                   'references', 'page_faults', 'fault_rate'])
+
+# divisor 为把共享序列转换成页号时用的页大小；共享的已是页号时为1，page_size 只用于结果
+_SweepJob = namedtuple('_SweepJob', ['shm_name', 'length', 'algorithm', 'memory_blocks', 'page_size', 'divisor',
+                                     'seed'])
+
+# 工作进程内的缓存：已挂载的共享内存，以及最近一次转换的页号序列
+_attached = {}
+_translated_key = None
+_translated_pages = None
+
+_SHARE_CHUNK = 1 << 16  # 写入共享内存时每块转换的地址数
+
+
+def _share_sequence(sequence):
+    """
+    将逻辑地址序列写入一块新的共享内存
+
+    直接写入共享内存的视图，不先复制出整个序列：8字节整数的缓冲区（如 array('q')、
+    mapped 格式trace的内存映射视图）按字节整体复制，其他序列逐块转换后写入。
+    """
+    length = len(sequence)
+    shm = shared_memory.SharedMemory(create=True, size=max(length, 1) * 8)
+    try:
+        with shm.buf.cast('q') as view:
+            source = memoryview(sequence) if isinstance(sequence, (array, memoryview)) else None
+            if source is not None and source.itemsize == 8 and source.format in ('q', 'Q'):
+                with source, source.cast('B') as raw, view.cast('B') as target:
+                    target[:len(raw)] = raw
+            else:
+                for start in range(0, length, _SHARE_CHUNK):
+                    view[start:start + _SHARE_CHUNK] = array('q', sequence[start:start + _SHARE_CHUNK])
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    return shm
+
+
+def _init_worker():
+    """工作进程初始化：退出时关闭本进程挂载的共享内存"""
+    # ProcessPoolExecutor 的工作进程退出时不运行 atexit 回调，但会运行 multiprocessing 的终结器
+    util.Finalize(None, _detach_shared, exitpriority=10)
+
+
+def _detach_shared():
+    """关闭工作进程挂载的共享内存（只解除映射，共享内存由主进程释放）"""
+    for shm in _attached.values():
+        shm.close()
+    _attached.clear()
+
+
+def _translate_shared(name, length, page_size):
+    """在工作进程中挂载共享内存并转换为页号序列，视图用完即释放"""
+    if name not in _attached:
+        # 工作进程与主进程共用同一个资源跟踪器，共享内存统一由主进程在扫描结束后释放
+        _attached[name] = shared_memory.SharedMemory(name=name)
+    with _attached[name].buf.cast('q') as view:
+        return translate_addresses(view[:length], page_size)[0]
+
+
+def _run_job(job):
+    """在工作进程中执行一个扫描任务"""
+    global _translated_key, _translated_pages
+    key = (job.shm_name, job.divisor)
+    if key != _translated_key:
+        _translated_pages = _translate_shared(job.shm_name, job.length, job.divisor)
+        _translated_key = key
+    result = simulate_pages(job.algorithm, _translated_pages, job.memory_blocks)
+    return SweepRow(result.policy, job.memory_blocks, job.page_size, job.seed,
+                    result.references, result.page_faults, result.fault_rate)
+
+
+def run_sweep(algorithms, memory_blocks, page_sizes, seeds=(None,), sequence=None, max_workers=None,
+              workload='permutation', length=None, address_space=DEFAULT_ADDRESS_SPACE, sequence_page_size=None):
+    """
+    并行运行参数网格上的全部模拟
+
+    Args:
+        algorithms: 算法名称列表
+        memory_blocks: 内存块数列表
+        page_sizes: 页大小列表
+        seeds: 随机种子列表；未提供 sequence 时每个种子生成一个合成序列
+        sequence: 固定的逻辑地址序列（如读入的trace），提供时所有种子共用该序列
+        max_workers: 工作进程数（默认为CPU核数）
+        workload: 合成序列的访问模式，见 workloads.WORKLOAD_LABELS
+        length: 合成序列长度（默认等于地址空间大小）
+        address_space: 合成序列的逻辑地址空间大小
+        sequence_page_size: sequence 已是按此页大小转换好的页号时给出（如按页号存放的 mapped 格式trace），
+            此时 page_sizes 只能为该值
+
+    Returns:
+        list: SweepRow 列表，按 种子、页大小、算法、内存块数 排序
+    """
+    seeds = list(seeds)
+    if sequence_page_size is not None:
+        if sequence is None:
+            raise ValueError("sequence_page_size 只能与 sequence 一起使用")
+        others = sorted(set(page_sizes) - {sequence_page_size})
+        if others:
+            raise ValueError(f"序列已按页大小 {sequence_page_size} 转换为页号，无法改用 {others[0]}")
+    shared = {}
+    try:
+        if sequence is not None:
+            shm = _share_sequence(sequence)
+            shared.update((seed, (shm, len(sequence))) for seed in seeds)
+        else:
+            for seed in seeds:
+                generated = generate_workload(workload, address_space if length is None else length,
+                                              address_space, seed)
+                shared[seed] = (_share_sequence(generated), len(generated))
+        # 同一序列、同一页大小的任务相邻，工作进程可复用已转换的页号序列
+        jobs = [_SweepJob(shared[seed][0].name, shared[seed][1], algorithm.upper(), frames, page_size,
+                          page_size if sequence_page_size is None else 1, seed)
+                for seed, page_size, algorithm, frames
+                in itertools.product(seeds, page_sizes, algorithms, memory_blocks)]
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            return list(executor.map(_run_job, jobs, chunksize=max(1, len(jobs) // (4 * workers))))
+    finally:
+        for shm in {id(shm): shm for shm, _ in shared.values()}.values():
+            shm.close()
+            shm.unlink()
+
+
+def write_table(rows, file, fmt='csv'):
+    """
+    将扫描结果写成一张表
+
+    Args:
+        rows: SweepRow 列表
+        file: 输出的文本文件对象
+        fmt: 'csv' 或 'json'
+    """
+    if fmt == 'json':
+        json.dump([row._asdict() for row in rows], file, ensure_ascii=False, indent=2)
+        file.write('\n')
+    elif fmt == 'csv':
+        writer = csv.writer(file)
+        writer.writerow(SweepRow._fields)
+        writer.writerows(rows)
+    else:
+        raise ValueError(f"未知的输出格式: {fmt}")
+
+
+def _int_values(text):
+    """解析整数参数，支持 8、1-64 以及 1-64:2（带步长的闭区间）"""
+    try:
+        if '-' not in text.lstrip('-'):
+            return [int(text)]
+        bounds, _, step = text.partition(':')
+        start, end = bounds.split('-', 1)
+        return list(range(int(start), int(end) + 1, int(step or 1)))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"无法解析的整数或区间: {text}") from None
+
+
+def _flatten(groups):
+    return [value for group in groups for value in group]
+
+
+@contextlib.contextmanager
+def _open_trace(path, fmt, page_sizes):
+    """
+    打开扫描使用的trace；mapped 格式按文件头处理，与 trace_io.simulate_trace 一致
+
+    mapped 格式产生内存映射的视图，在 with 块内由 run_sweep 直接写入共享内存，不另做拷贝。
+    path 为None时（使用合成序列）不打开任何文件。
+
+    Yields:
+        tuple: (序列, 页大小列表, 序列已是页号时其页大小否则为None)
+    """
+    if path is None:
+        yield None, page_sizes, None
+        return
+    from trace_io import KIND_PAGE, detect_format, open_mapped_trace, read_trace
+    if (fmt or detect_format(path)) != 'mapped':
+        yield read_trace(path, fmt), page_sizes, None
+        return
+    with open_mapped_trace(path) as trace:
+        yield (trace.data, page_sizes or [trace.page_size],
+               trace.page_size if trace.kind == KIND_PAGE else None)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="页面置换算法参数扫描")
+    parser.add_argument('--algorithms', nargs='+', default=policy_names(), help="算法名称（默认全部已注册的算法）")
+    parser.add_argument('--frames', nargs='+', type=_int_values, default=[[4]], help="内存块数，可写区间如 1-64")
+    parser.add_argument('--page-sizes', nargs='+', type=_int_values,
+                        help="页大小，可写区间（默认10；mapped 格式trace默认取文件头中的页大小）")
+    parser.add_argument('--seeds', nargs='+', type=_int_values, default=[[0]], help="合成序列种子，可写区间")
+    parser.add_argument('--trace', help="trace文件路径，提供时不再生成合成序列")
+    parser.add_argument('--workload', choices=list(WORKLOAD_LABELS), default='permutation',
+                        help="合成序列的访问模式（默认permutation，即随机排列）")
+    parser.add_argument('--length', type=int, help="合成序列长度（默认等于地址空间大小）")
+    parser.add_argument('--address-space', type=int, default=DEFAULT_ADDRESS_SPACE,
+                        help=f"合成序列的逻辑地址空间大小（默认{DEFAULT_ADDRESS_SPACE}）")
+    parser.add_argument('--trace-format', help="trace格式（text/csv/binary/mapped），默认按扩展名判断")
+    parser.add_argument('--workers', type=int, help="工作进程数，默认为CPU核数")
+    parser.add_argument('--format', choices=['csv', 'json'], default='csv', help="输出格式")
+    parser.add_argument('--output', help="输出文件，默认为标准输出")
+    args = parser.parse_args(argv)
+
+    seeds = _flatten(args.seeds)
+    page_sizes = _flatten(args.page_sizes) if args.page_sizes else None
+    try:
+        with _open_trace(args.trace, args.trace_format, page_sizes) as (sequence, page_sizes, sequence_page_size):
+            rows = run_sweep(args.algorithms, _flatten(args.frames), page_sizes or [10],
+                             [None] if args.trace else seeds, sequence=sequence, max_workers=args.workers,
+                             workload=args.workload, length=args.length, address_space=args.address_space,
+                             sequence_page_size=sequence_page_size)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            write_table(rows, f, args.format)
+    else:
+        write_table(rows, sys.stdout, args.format)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,522 @@
+"""
+地址访问序列（trace）的流式读取
+
+支持三种格式：
+- text：每行一个逻辑地址（十进制，或以0x开头的十六进制），空行和以 # 开头的注释行忽略
+- csv：取指定列为逻辑地址，首行无法解析为地址时视为表头跳过
+- binary：连续存放的小端无符号整数，每个地址占 4 或 8 字节
+- mapped：带文件头的定宽二进制格式（见 write_mapped_trace），通过 mmap 零拷贝读取
+
+读取时按块产生地址，整个序列不会一次性载入内存。FIFO/LRU 可直接在地址流上运行；
+OPT 先正向扫描一遍把下次使用位置索引写入磁盘临时文件，再与地址流一起第二遍扫描。
+"""
+import csv
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from page_replacement_core import get_policy, load_numpy, simulate_stream, translate_addresses
+
+DEFAULT_CHUNK_SIZE = 1 << 16  # 每块地址数
+DEFAULT_PAGE_SIZE = 10  # 非 mapped 格式未指定页大小时使用的页大小
+
+_FORMAT_BY_EXTENSION = {
+    '.txt': 'text',
+    '.trace': 'text',
+    '.csv': 'csv',
+    '.bin': 'binary',
+    '.pgtrace': 'mapped',
+}
+
+_BINARY_TYPECODES = {4: 'I', 8: 'Q'}
+
+
+def detect_format(path):
+    """
+    根据扩展名判断trace格式，无法识别时按文本处理
+
+    Returns:
+        str: 'text'、'csv'、'binary' 或 'mapped'
+    """
+    return _FORMAT_BY_EXTENSION.get(os.path.splitext(path)[1].lower(), 'text')
+
+
+def _parse_address(token):
+    token = token.strip()
+    if token[:2] in ('0x', '0X'):
+        return int(token, 16)
+    return int(token)
+
+
+def _iter_text_chunks(path, chunk_size):
+    chunk = []
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            try:
+                chunk.append(_parse_address(line))
+            except ValueError:
+                raise ValueError(f"{path}:{line_number}: 无法解析的地址 {line!r}") from None
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _iter_csv_chunks(path, chunk_size, column):
+    chunk = []
+    with open(path, encoding='utf-8', newline='') as f:
+        for row_number, row in enumerate(csv.reader(f), 1):
+            if not row:
+                continue
+            try:
+                chunk.append(_parse_address(row[column]))
+            except (ValueError, IndexError):
+                if row_number == 1:
+                    continue  # 表头
+                raise ValueError(f"{path}:{row_number}: 第{column}列无法解析为地址 {row!r}") from None
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def _iter_binary_chunks(path, chunk_size, width):
+    typecode = _BINARY_TYPECODES.get(width)
+    if typecode is None:
+        raise ValueError(f"二进制trace的地址宽度只能为4或8字节: {width}")
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(chunk_size * width)
+            if not data:
+                break
+            if len(data) % width:
+                raise ValueError(f"{path}: 文件长度不是地址宽度 {width} 的整数倍")
+            chunk = array(typecode)
+            chunk.frombytes(data)
+            if sys.byteorder == 'big':
+                chunk.byteswap()
+            yield chunk
+
+
+# mapped格式文件头：魔数、版本、每项字节数、内容类型、页大小、项数（小端）
+MAPPED_MAGIC = b'PGTR'
+MAPPED_VERSION = 1
+_MAPPED_HEADER = struct.Struct('<4sHBBQQ')
+KIND_ADDRESS = 0  # 数据为逻辑地址
+KIND_PAGE = 1  # 数据为已按页大小转换好的页号
+
+
+class MappedTrace:
+    """
+    以内存映射方式打开的 mapped 格式trace
+
+    data 为直接指向映射内存的视图（零拷贝），可直接交给模拟内核迭代或按下标访问。
+
+    Attributes:
+        kind: KIND_ADDRESS 或 KIND_PAGE
+        page_size: 写入时的页大小（KIND_PAGE 时页号按此页大小转换）
+        width: 每项字节数（4或8）
+        length: 项数
+        data: 数据视图（memoryview）
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = None
+        self.data = None
+        try:
+            header = self._file.read(_MAPPED_HEADER.size)
+            if len(header) < _MAPPED_HEADER.size:
+                raise ValueError(f"{path}: 文件过短，不是mapped格式trace")
+            magic, version, width, kind, page_size, length = _MAPPED_HEADER.unpack(header)
+            if magic != MAPPED_MAGIC:
+                raise ValueError(f"{path}: 文件头魔数不匹配，不是mapped格式trace")
+            if version != MAPPED_VERSION:
+                raise ValueError(f"{path}: 不支持的mapped格式版本 {version}")
+            if width not in _BINARY_TYPECODES or kind not in (KIND_ADDRESS, KIND_PAGE):
+                raise ValueError(f"{path}: 文件头损坏（width={width}, kind={kind}）")
+            if os.path.getsize(path) < _MAPPED_HEADER.size + length * width:
+                raise ValueError(f"{path}: 数据长度与文件头记录的 {length} 项不符")
+            self.width, self.kind, self.page_size, self.length = width, kind, page_size, length
+            typecode = _BINARY_TYPECODES[width]
+            if length and sys.byteorder == 'little':
+                self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                start = _MAPPED_HEADER.size
+                self.data = memoryview(self._mmap)[start:start + length * width].cast(typecode)
+            else:
+                # 数据按小端存放，大端主机上只能读入后转换字节序
+                values = array(typecode, self._file.read(length * width))
+                values.byteswap()
+                self.data = memoryview(values)
+        except BaseException:
+            self.close()
+            raise
+
+    def __len__(self):
+        return self.length
+
+    def pages(self, page_size=None):
+        """
+        获取页号序列
+
+        KIND_PAGE 时直接返回数据视图（零拷贝）；KIND_ADDRESS 时按页大小批量转换。
+
+        Args:
+            page_size: 页大小，默认使用文件头中的页大小
+        """
+        page_size = self.page_size if page_size is None else page_size
+        if page_size < 1:
+            raise ValueError(f"页大小必须为正整数: {page_size}")
+        if self.kind == KIND_PAGE:
+            if page_size != self.page_size:
+                raise ValueError(f"{self.path}: 页号已按页大小 {self.page_size} 转换，无法改用 {page_size}")
+            return self.data
+        return translate_addresses(self.data, page_size)[0]
+
+    def as_numpy(self):
+        """以NumPy数组形式查看数据（零拷贝，需要安装NumPy）"""
+        np = load_numpy()
+        if np is None:
+            raise RuntimeError("as_numpy 需要安装NumPy")
+        return np.frombuffer(self.data, dtype=f'<u{self.width}')
+
+    def iter_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        """按块产生数据视图的切片（零拷贝）"""
+        for start in range(0, self.length, chunk_size):
+            yield self.data[start:start + chunk_size]
+
+    def close(self):
+        """释放内存映射并关闭文件"""
+        if self.data is not None:
+            self.data.release()
+            self.data = None
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # 调用方仍持有数据视图的切片（如模拟中途抛出异常时）：不掩盖原来的异常，
+                # 映射在最后一个切片被回收后自动解除
+                pass
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_mapped_trace(path):
+    """
+    以内存映射方式打开 mapped 格式trace
+
+    Returns:
+        MappedTrace: 需在使用完毕后 close()，也可用 with 语句
+    """
+    return MappedTrace(path)
+
+
+def write_mapped_trace(path, sequence, page_size=10, store_pages=True, width=None):
+    """
+    将内存中的逻辑地址序列写成 mapped 格式trace
+
+    Args:
+        path: 输出文件路径
+        sequence: 逻辑地址序列（如 generate_random_sequence() 的结果）
+        page_size: 页大小
+        store_pages: 为True时写入按页大小转换好的页号，回放时无需再做地址转换
+        width: 每项字节数（4或8），默认按最大值自动选择
+    """
+    values = translate_addresses(sequence, page_size)[0] if store_pages else sequence
+    if width is None:
+        width = 4 if max(values, default=0) < (1 << 32) else 8
+    with _MappedTraceWriter(path, page_size, store_pages, width) as writer:
+        writer.write(values)
+
+
+def convert_trace(source, destination, fmt=None, page_size=10, store_pages=True, width=8,
+                  column=0, source_width=8, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    将 text/csv/binary 格式的trace流式转换为 mapped 格式，转换后回放无需再解析文本
+
+    Args:
+        source: 源trace路径
+        destination: 输出的 mapped 格式文件路径
+        fmt: 源trace格式，默认按扩展名判断
+        page_size, store_pages, width: 见 write_mapped_trace（流式转换时 width 需预先指定）
+        column: 源为csv时地址所在的列
+        source_width: 源为binary时每个地址的字节数
+    """
+    write_mapped_chunks(destination, iter_trace_chunks(source, fmt, chunk_size, column, source_width),
+                        page_size, store_pages, width)
+
+
+def write_mapped_chunks(path, chunks, page_size=10, store_pages=True, width=8):
+    """
+    将按块产生的逻辑地址流式写成 mapped 格式trace（如 workloads.iter_workload 的结果）
+
+    Args:
+        path: 输出文件路径
+        chunks: 逻辑地址块的可迭代对象
+        page_size, store_pages, width: 见 write_mapped_trace（流式写入时 width 需预先指定）
+    """
+    with _MappedTraceWriter(path, page_size, store_pages, width) as writer:
+        for chunk in chunks:
+            writer.write(translate_addresses(chunk, page_size)[0] if store_pages else chunk)
+
+
+class _MappedTraceWriter:
+    """分块写入 mapped 格式trace，结束时回填文件头中的项数"""
+
+    def __init__(self, path, page_size, store_pages, width):
+        if width not in _BINARY_TYPECODES:
+            raise ValueError(f"mapped格式的每项字节数只能为4或8: {width}")
+        self._file = open(path, 'wb')
+        self._typecode = _BINARY_TYPECODES[width]
+        self._header = (MAPPED_MAGIC, MAPPED_VERSION, width,
+                        KIND_PAGE if store_pages else KIND_ADDRESS, page_size)
+        self.length = 0
+        self._file.write(_MAPPED_HEADER.pack(*self._header, 0))
+
+    def write(self, values):
+        try:
+            chunk = array(self._typecode, values)
+        except OverflowError:
+            raise ValueError("数据超出mapped格式每项字节数的表示范围") from None
+        if sys.byteorder == 'big':
+            chunk.byteswap()
+        self._file.write(chunk.tobytes())
+        self.length += len(chunk)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        try:
+            if exc_type is None:
+                self._file.seek(0)
+                self._file.write(_MAPPED_HEADER.pack(*self._header, self.length))
+        finally:
+            self._file.close()
+
+
+def _iter_mapped_chunks(path, chunk_size):
+    with open_mapped_trace(path) as trace:
+        for chunk in trace.iter_chunks(chunk_size):
+            # 先释放切片再交出数据，否则退出 with 时映射仍被切片引用而无法关闭
+            with chunk:
+                values = chunk.tolist()
+            yield values
+
+
+def iter_trace_chunks(path, fmt=None, chunk_size=DEFAULT_CHUNK_SIZE, column=0, width=8):
+    """
+    按块读取trace中的逻辑地址
+
+    mapped 格式按原样产生其中存放的数据（写入时选择了存放页号则产生的是页号）。
+
+    Args:
+        path: trace文件路径
+        fmt: 'text'、'csv'、'binary' 或 'mapped'，默认按扩展名判断
+        chunk_size: 每块地址数
+        column: csv格式中地址所在的列
+        width: binary格式中每个地址的字节数（4或8）
+
+    Yields:
+        逻辑地址块（整数序列）
+    """
+    fmt = fmt or detect_format(path)
+    if fmt == 'mapped':
+        return _iter_mapped_chunks(path, chunk_size)
+    if fmt == 'text':
+        return _iter_text_chunks(path, chunk_size)
+    if fmt == 'csv':
+        return _iter_csv_chunks(path, chunk_size, column)
+    if fmt == 'binary':
+        return _iter_binary_chunks(path, chunk_size, width)
+    raise ValueError(f"未知的trace格式: {fmt}")
+
+
+def iter_trace(path, fmt=None, chunk_size=DEFAULT_CHUNK_SIZE, column=0, width=8):
+    """
+    逐个产生trace中的逻辑地址，参数同 iter_trace_chunks
+    """
+    for chunk in iter_trace_chunks(path, fmt, chunk_size, column, width):
+        yield from chunk
+
+
+def read_trace(path, fmt=None, column=0, width=8):
+    """
+    将整个trace读入为逻辑地址列表（适用于可以放入内存的trace）
+    """
+    return list(iter_trace(path, fmt, column=column, width=width))
+
+
+class SpilledNextUse:
+    """
+    写入磁盘临时文件的OPT下次使用位置索引
+
+    正向扫描一遍地址流：记录每个页面最近一次出现的位置，页面再次出现时
+    回填上一次出现位置的下次使用位置。索引按8字节整数存放在内存映射的临时文件中，
+    内存中只保留每个页面最近一次出现的位置。
+    """
+
+    def __init__(self, chunks, length, page_size=10, spill_dir=None):
+        """
+        Args:
+            chunks: 逻辑地址块的可迭代对象
+            length: 地址总数
+            page_size: 每页大小
+            spill_dir: 临时文件所在目录（默认系统临时目录）
+        """
+        self.length = length
+        self._file = tempfile.TemporaryFile(dir=spill_dir)
+        self._mmap = None
+        if length == 0:
+            return
+        # 先全部填为"之后不再使用"
+        block = array('q', [length]) * min(length, DEFAULT_CHUNK_SIZE)
+        remaining = length
+        while remaining:
+            count = min(remaining, len(block))
+            self._file.write(block[:count].tobytes())
+            remaining -= count
+        self._file.flush()
+        self._mmap = mmap.mmap(self._file.fileno(), length * 8)
+        index = memoryview(self._mmap).cast('q')
+        try:
+            last_seen = {}
+            position = 0
+            for chunk in chunks:
+                page_numbers, _ = translate_addresses(chunk, page_size)
+                for page in page_numbers:
+                    previous = last_seen.get(page)
+                    if previous is not None:
+                        index[previous] = position
+                    last_seen[page] = position
+                    position += 1
+        finally:
+            index.release()
+
+    def __iter__(self):
+        """按顺序分块读出下次使用位置"""
+        if self._mmap is None:
+            return
+        index = memoryview(self._mmap).cast('q')
+        try:
+            for start in range(0, self.length, DEFAULT_CHUNK_SIZE):
+                yield from index[start:start + DEFAULT_CHUNK_SIZE].tolist()
+        finally:
+            index.release()
+
+    def close(self):
+        """释放内存映射并删除临时文件"""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def count_trace(path, fmt=None, column=0, width=8):
+    """
+    统计trace中的地址数（二进制格式直接由文件大小得到）
+    """
+    fmt = fmt or detect_format(path)
+    if fmt == 'mapped':
+        with open_mapped_trace(path) as trace:
+            return trace.length
+    if fmt == 'binary':
+        return os.path.getsize(path) // width
+    return sum(len(chunk) for chunk in iter_trace_chunks(path, fmt, column=column, width=width))
+
+
+def simulate_trace(policy, path, frames, page_size=None, fmt=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                   column=0, width=8, spill_dir=None):
+    """
+    在trace文件上流式运行页面置换模拟
+
+    大多数算法单遍扫描，内存占用只与内存块数有关；OPT等需要未来信息的算法（needs_future）
+    先扫描一遍建立写入磁盘的下次使用位置索引（SpilledNextUse），再扫描一遍进行模拟。
+    mapped 格式直接在内存映射的数据上运行，不做解析和拷贝。
+
+    Args:
+        policy: 算法名称（见 page_replacement_core.policy_names，不区分大小写）
+        path: trace文件路径
+        frames: 内存块数
+        page_size: 每页大小，默认为10；mapped 格式默认取文件头中的页大小
+        fmt, chunk_size, column, width: 见 iter_trace_chunks
+        spill_dir: OPT索引临时文件所在目录
+
+    Returns:
+        SimulationResult: 模拟结果（不含事件记录）
+    """
+    fmt = fmt or detect_format(path)
+    if page_size is not None and page_size < 1:
+        raise ValueError(f"页大小必须为正整数: {page_size}")
+    if fmt == 'mapped':
+        with open_mapped_trace(path) as trace:
+            if trace.kind == KIND_PAGE:
+                if page_size not in (None, trace.page_size):
+                    raise ValueError(f"{path}: 页号已按页大小 {trace.page_size} 转换，无法改用 {page_size}")
+                page_size = 1  # 数据已是页号
+            else:
+                page_size = trace.page_size if page_size is None else page_size
+            return _simulate_chunks(policy, lambda: trace.iter_chunks(chunk_size), trace.length,
+                                    frames, page_size, spill_dir)
+
+    def chunks():
+        return iter_trace_chunks(path, fmt, chunk_size, column, width)
+
+    length = count_trace(path, fmt, column, width) if get_policy(policy).needs_future else None
+    return _simulate_chunks(policy, chunks, length, frames, DEFAULT_PAGE_SIZE if page_size is None else page_size,
+                            spill_dir)
+
+
+def effective_page_size(path, fmt=None, page_size=None):
+    """
+    求在trace上模拟时实际使用的页大小（与 simulate_trace 的默认规则一致）
+
+    Args:
+        path: trace文件路径
+        fmt: trace格式，默认按扩展名判断
+        page_size: 指定的页大小，为None时使用默认值
+
+    Returns:
+        int: 指定了页大小时为该值，否则 mapped 格式取文件头中的页大小，其余格式为 DEFAULT_PAGE_SIZE
+    """
+    if page_size is not None:
+        if page_size < 1:
+            raise ValueError(f"页大小必须为正整数: {page_size}")
+        return page_size
+    if (fmt or detect_format(path)) == 'mapped':
+        with open_mapped_trace(path) as trace:
+            return trace.page_size
+    return DEFAULT_PAGE_SIZE
+
+
+def _simulate_chunks(policy, chunks, length, frames, page_size, spill_dir):
+    """在可重复产生的地址块流上运行模拟，OPT等需要未来信息的算法使用写入磁盘的下次使用位置索引"""
+    if not get_policy(policy).needs_future:
+        return simulate_stream(policy, chunks(), frames, page_size)
+    with SpilledNextUse(chunks(), length, page_size, spill_dir) as next_use:
+        next_use_stream = iter(next_use)
+        try:
+            return simulate_stream(policy, chunks(), frames, page_size, next_use=next_use_stream)
+        finally:
+            next_use_stream.close()
@@ -0,0 +1,259 @@
+"""
+可复现的合成访问序列（workload）生成器
+
+generate_random_sequence 只能得到 0-319 的一个随机排列，既不能更长，也没有任何局部性。
+本模块按种子生成任意长度的逻辑地址序列，提供几种常见的访问模式：
+
+- permutation：地址空间的随机排列，依次拼接；与 generate_random_sequence 使用相同的随机流，
+  同一种子下前 address_space 个地址与之完全一致
+- zipf：按 Zipf 分布访问，地址越小越热
+- working-set：分阶段的工作集，每个阶段在一段随机位置的连续地址内均匀访问
+- scan：从随机位置开始的一段段顺序扫描
+- loop：反复循环访问前 loop_size 个地址
+- mix：经典的指令流，50% 顺序执行、25% 跳到前面的地址、25% 跳到后面的地址
+
+序列按块生成，iter_workload 每次产生一块 array('q')，可边生成边写入trace文件而不必整体载入内存。
+安装了NumPy时（permutation 除外）使用NumPy的随机数生成器向量化生成，因此同一种子在有无NumPy的
+环境下得到的序列不同，但在同一环境下总是相同的。
+
+用法示例：
+    python workloads.py zipf --length 10000000 --seed 1 --output zipf.pgtrace
+    python workloads.py mix --length 100000 --address-space 320 --output mix.pgtrace --page-size 10
+"""
+import argparse
+import bisect
+import itertools
+import random
+import sys
+from array import array
+
+from page_replacement_core import load_numpy
+
+DEFAULT_ADDRESS_SPACE = 320
+CHUNK_SIZE = 1 << 16  # 每块地址数；固定不变，保证生成结果与读取方式无关
+
+WORKLOAD_LABELS = {
+    'permutation': "随机排列",
+    'zipf': "Zipf热点",
+    'working-set': "工作集阶段",
+    'scan': "顺序扫描",
+    'loop': "循环访问",
+    'mix': "经典指令流（50/25/25）",
+}
+
+
+def _rng(seed):
+    """按种子创建随机数生成器：有NumPy时为 numpy.random.Generator，否则为 random.Random"""
+    np = load_numpy()
+    return np.random.default_rng(seed) if np is not None else random.Random(seed)
+
+
+def _to_array(values):
+    """将一块地址（列表或NumPy数组）转换为 array('q')"""
+    if isinstance(values, array):
+        return values
+    if hasattr(values, 'tobytes'):
+        chunk = array('q')
+        chunk.frombytes(values.astype('=i8', copy=False).tobytes())
+        return chunk
+    return array('q', values)
+
+
+def _chunk_bounds(length):
+    for start in range(0, length, CHUNK_SIZE):
+        yield start, min(CHUNK_SIZE, length - start)
+
+
+def _permutation(length, address_space, seed):
+    # 始终使用 random.Random，以便与 generate_random_sequence(seed) 的结果一致
+    rng = random.Random(seed)
+    remaining = length
+    while remaining > 0:
+        sequence = list(range(address_space))
+        rng.shuffle(sequence)
+        yield array('q', sequence[:remaining])
+        remaining -= address_space
+
+
+def _zipf(length, address_space, seed, alpha=1.0):
+    if alpha < 0:
+        raise ValueError("Zipf分布的指数不能为负数")
+    rng = _rng(seed)
+    np = load_numpy()
+    if np is not None:
+        # 有界Zipf分布：按累积分布函数做逆变换抽样
+        cdf = np.cumsum(np.arange(1, address_space + 1, dtype=np.float64) ** -alpha)
+        cdf /= cdf[-1]
+        for _, size in _chunk_bounds(length):
+            yield np.minimum(np.searchsorted(cdf, rng.random(size), side='right'), address_space - 1)
+    else:
+        cum_weights = list(itertools.accumulate(rank ** -alpha for rank in range(1, address_space + 1)))
+        total = cum_weights[-1]
+        for _, size in _chunk_bounds(length):
+            yield [min(bisect.bisect_right(cum_weights, rng.random() * total), address_space - 1)
+                   for _ in range(size)]
+
+
+def _working_set(length, address_space, seed, set_size=None, phase_length=1000):
+    set_size = max(1, address_space // 10) if set_size is None else set_size
+    if not 1 <= set_size <= address_space:
+        raise ValueError(f"工作集大小必须在1到{address_space}之间")
+    if phase_length < 1:
+        raise ValueError("阶段长度必须为正整数")
+    rng = _rng(seed)
+    np = load_numpy()
+    bases, first = [], 0  # 各阶段工作集的起始地址，bases[0] 对应第 first 个阶段
+    for start, size in _chunk_bounds(length):
+        # 只保留本块用到的阶段，阶段很短时也不会累积
+        del bases[:start // phase_length - first]
+        first = start // phase_length
+        missing = (start + size - 1) // phase_length + 1 - first - len(bases)
+        if np is not None:
+            bases.extend(rng.integers(0, address_space - set_size + 1, size=missing).tolist())
+            phases = np.arange(start, start + size) // phase_length - first
+            yield np.asarray(bases)[phases] + rng.integers(0, set_size, size=size)
+        else:
+            bases.extend(rng.randrange(address_space - set_size + 1) for _ in range(missing))
+            yield [bases[i // phase_length - first] + rng.randrange(set_size) for i in range(start, start + size)]
+
+
+def _scan(length, address_space, seed, run_length=None):
+    run_length = max(1, address_space // 4) if run_length is None else run_length
+    if run_length < 1:
+        raise ValueError("扫描长度必须为正整数")
+    rng = _rng(seed)
+    np = load_numpy()
+    starts, first = [], 0  # 各段扫描的起始地址，starts[0] 对应第 first 段
+    for start, size in _chunk_bounds(length):
+        del starts[:start // run_length - first]
+        first = start // run_length
+        missing = (start + size - 1) // run_length + 1 - first - len(starts)
+        if np is not None:
+            starts.extend(rng.integers(0, address_space, size=missing).tolist())
+            steps = np.arange(start, start + size)
+            yield (np.asarray(starts)[steps // run_length - first] + steps % run_length) % address_space
+        else:
+            starts.extend(rng.randrange(address_space) for _ in range(missing))
+            yield [(starts[i // run_length - first] + i % run_length) % address_space
+                   for i in range(start, start + size)]
+
+
+def _loop(length, address_space, seed, loop_size=None):
+    loop_size = max(1, address_space // 2) if loop_size is None else loop_size
+    if not 1 <= loop_size <= address_space:
+        raise ValueError(f"循环长度必须在1到{address_space}之间")
+    np = load_numpy()
+    for start, size in _chunk_bounds(length):
+        if np is not None:
+            yield np.arange(start, start + size) % loop_size
+        else:
+            yield [i % loop_size for i in range(start, start + size)]
+
+
+def _mix(length, address_space, seed):
+    # 每4条指令为一轮：顺序执行、跳到[0, x]、顺序执行、跳到[x+1, 末尾]，各部分占 50%/25%/25%
+    rng = _rng(seed)
+    np = load_numpy()
+    address = None
+    for start, size in _chunk_bounds(length):
+        uniforms = rng.random(size).tolist() if np is not None else [rng.random() for _ in range(size)]
+        chunk = array('q', bytes(8 * size))
+        for i, u in enumerate(uniforms):
+            step = (start + i) & 3
+            if address is None:
+                address = int(u * address_space)  # 随机的起始地址
+            elif step == 0 or step == 2:
+                address = address + 1 if address + 1 < address_space else 0
+            elif step == 1:
+                address = int(u * (address + 1))
+            else:
+                low = address + 1 if address + 1 < address_space else 0
+                address = low + int(u * (address_space - low))
+            chunk[i] = address
+        yield chunk
+
+
+_GENERATORS = {
+    'permutation': _permutation,
+    'zipf': _zipf,
+    'working-set': _working_set,
+    'scan': _scan,
+    'loop': _loop,
+    'mix': _mix,
+}
+
+
+def iter_workload(kind, length, address_space=DEFAULT_ADDRESS_SPACE, seed=None, **params):
+    """
+    按块生成合成访问序列
+
+    Args:
+        kind: 访问模式，见 WORKLOAD_LABELS
+        length: 序列长度（任意非负整数）
+        address_space: 逻辑地址空间大小，地址取值为 0 到 address_space-1
+        seed: 随机种子，为None时每次结果不同
+        **params: 访问模式的参数：zipf 的 alpha；working-set 的 set_size、phase_length；
+            scan 的 run_length；loop 的 loop_size
+
+    Returns:
+        iterator: 依次产生 array('q') 形式的地址块
+    """
+    if kind not in _GENERATORS:
+        raise ValueError(f"未知的访问模式: {kind}")
+    if length < 0:
+        raise ValueError("序列长度不能为负数")
+    if address_space < 1:
+        raise ValueError("地址空间大小必须为正整数")
+    # 先创建生成器再取第一块，使参数错误在调用时立即抛出
+    chunks = _GENERATORS[kind](length, address_space, seed, **params)
+    first = next(chunks, None)
+    if first is None:
+        return iter(())
+    return map(_to_array, itertools.chain((first,), chunks))
+
+
+def generate_workload(kind, length, address_space=DEFAULT_ADDRESS_SPACE, seed=None, **params):
+    """
+    生成完整的合成访问序列
+
+    Args:
+        kind, length, address_space, seed, **params: 见 iter_workload
+
+    Returns:
+        array: array('q') 形式的逻辑地址序列
+    """
+    sequence = array('q')
+    for chunk in iter_workload(kind, length, address_space, seed, **params):
+        sequence.extend(chunk)
+    return sequence
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="生成合成访问序列并写成 mapped 格式trace")
+    parser.add_argument('kind', choices=list(_GENERATORS), help="访问模式")
+    parser.add_argument('--length', type=int, required=True, help="序列长度")
+    parser.add_argument('--address-space', type=int, default=DEFAULT_ADDRESS_SPACE,
+                        help=f"逻辑地址空间大小（默认{DEFAULT_ADDRESS_SPACE}）")
+    parser.add_argument('--seed', type=int, help="随机种子")
+    parser.add_argument('--alpha', type=float, help="zipf：分布指数（默认1.0）")
+    parser.add_argument('--set-size', type=int, help="working-set：工作集大小（默认地址空间的1/10）")
+    parser.add_argument('--phase-length', type=int, help="working-set：每个阶段的访问次数（默认1000）")
+    parser.add_argument('--run-length', type=int, help="scan：每段扫描的长度（默认地址空间的1/4）")
+    parser.add_argument('--loop-size', type=int, help="loop：循环访问的地址数（默认地址空间的一半）")
+    parser.add_argument('--page-size', type=int, default=10, help="写入trace文件头的页大小（默认10）")
+    parser.add_argument('--store-pages', action='store_true', help="写入按页大小转换好的页号而不是逻辑地址")
+    parser.add_argument('--output', required=True, help="输出的 mapped 格式trace路径")
+    args = parser.parse_args(argv)
+
+    params = {name: getattr(args, name) for name in ('alpha', 'set_size', 'phase_length', 'run_length', 'loop_size')
+              if getattr(args, name) is not None}
+    from trace_io import write_mapped_chunks
+    try:
+        chunks = iter_workload(args.kind, args.length, args.address_space, args.seed, **params)
+        write_mapped_chunks(args.output, chunks, args.page_size, args.store_pages)
+    except (ValueError, TypeError) as e:
+        parser.error(str(e))
+
+
+if __name__ == '__main__':
+    sys.exit(main())